@@ -110,6 +110,8 @@ LLM_PROVIDER=deepseek
 # Advanced Settings
 MAX_RESULTS=50
 ARXIV_MAX_RESULTS=100
+ARXIV_DELAY_SECONDS=3.0
+ARXIV_PAGE_SIZE=100
 CHROMA_PERSIST_DIRECTORY=./data/chroma_db
 OUTPUT_DIR=./data/outputs
 """
@@ -14,7 +14,7 @@ from .retrieval.arxiv_client import ArxivClient
 from .retrieval.base_retriever import LiteratureItem
 from .retrieval.pdf_processor import PDFProcessor
 # Semantic Scholar removed - using ArXiv only
-from .utils.config import Config
+from .utils.config import Config, get_config
 from .utils.logger import LoggerMixin, get_logger, setup_logger
 from .utils.display import display, print_status, print_error, print_success
 from .ai_core.summarizer import Summarizer
@@ -38,7 +38,7 @@ class LiteratureAgent(LoggerMixin):
             config: Configuration object (uses default if None)
         """
         super().__init__()
-        self.config = config if config else Config()
+        self.config = config if config else get_config()
 
         # Initialize components
         self.llm_manager = LLMManager(config=self.config)
@@ -55,7 +55,10 @@ class LiteratureAgent(LoggerMixin):
         )
 
         self.arxiv_client = ArxivClient(
-            api_url=self.config.arxiv_api_url, max_results=self.config.arxiv_max_results
+            api_url=self.config.arxiv_api_url,
+            max_results=self.config.arxiv_max_results,
+            delay_seconds=self.config.arxiv_delay_seconds,
+            page_size=self.config.arxiv_page_size,
         )
 
         self.pdf_processor = PDFProcessor()
@@ -955,8 +958,9 @@ if __name__ == "__main__":
             display.print_rule("Detailed Paper Information")
 
             # Show only first 3 in detail
-            for i, paper in enumerate(review_results["processed_papers"][:3], 1):
-                display.print_paper_details(paper, i)
+            with display.batch_output():
+                for i, paper in enumerate(review_results["processed_papers"][:3], 1):
+                    display.print_paper_details(paper, i)
 
         # Show completion message
         display.print_rule("Review Complete")
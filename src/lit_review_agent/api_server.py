@@ -25,10 +25,12 @@ if str(current_dir) not in sys.path:
 try:
     from src.lit_review_agent.agent import LiteratureAgent
     from src.lit_review_agent.utils.config import Config
+    from src.lit_review_agent.utils.performance_monitor import get_performance_monitor
 except ImportError as e:
     print(f"Warning: Could not import modules: {e}")
     LiteratureAgent = None
     Config = None
+    get_performance_monitor = None
 
 # 导入认证中间件 - 移除过度宽泛的异常处理
 # print("🔧 Importing authentication middleware...")
@@ -100,14 +102,27 @@ async def lifespan(app: FastAPI):
         print(f">> 代理初始化异常: {e}")
         print(">> 将使用模拟数据模式运行")
 
+    # 在事件循环内创建性能监控器，系统指标采样由 loop.call_later 调度，无需额外线程
+    if get_performance_monitor is not None:
+        get_performance_monitor().start_system_monitoring()
+
     yield
 
+    if get_performance_monitor is not None:
+        get_performance_monitor().stop_system_monitoring()
+
     # 关闭时清理
     print(">> 关闭 AI Literature Review API 服务器...")
     global literature_agent
     if literature_agent:
         try:
             # 清理资源
+            arxiv_client = getattr(literature_agent, "arxiv_client", None)
+            if arxiv_client is not None:
+                await arxiv_client.aclose()
+            pdf_processor = getattr(literature_agent, "pdf_processor", None)
+            if pdf_processor is not None:
+                await pdf_processor.aclose()
             literature_agent = None
             print(">> 资源清理完成")
         except Exception as e:
@@ -14,7 +14,7 @@ from rich.table import Table
 from rich.prompt import Prompt
 
 from .agent import LiteratureAgent
-from .utils.config import Config
+from .utils.config import get_config
 from .utils.logger import get_logger, setup_logger
 from .__init__ import __version__ as agent_version
 
@@ -62,7 +62,7 @@ def setup():
     )
 
     try:
-        config = Config()
+        config = get_config()
 
         # Check current configuration
         console.print("[bold yellow]Current Configuration Status:[/bold yellow]")
@@ -114,7 +114,7 @@ def config_info():
     """
     console.print("[bold cyan]📋 Current Agent Configuration:[/bold cyan]")
     try:
-        config = Config()
+        config = get_config()
         table = Table(
             title="Configuration Details", show_header=True, header_style="bold magenta"
         )
@@ -185,7 +185,7 @@ def review(
 
     try:
         # Initialize agent
-        agent_config = Config()
+        agent_config = get_config()
         agent = LiteratureAgent(config=agent_config)
 
         source_list = (
@@ -299,7 +299,7 @@ def generate_report(
             review_data = json.load(f)
 
         # Initialize agent
-        agent_config = Config()
+        agent_config = get_config()
         agent = LiteratureAgent(config=agent_config)
 
         # Generate report
@@ -338,7 +338,7 @@ def search(
 
     try:
         # Initialize agent
-        agent_config = Config()
+        agent_config = get_config()
         agent = LiteratureAgent(config=agent_config)
 
         # Search
@@ -381,7 +381,7 @@ def stats():
 
     try:
         # Initialize agent
-        agent_config = Config()
+        agent_config = get_config()
         agent = LiteratureAgent(config=agent_config)
 
         # Get statistics
@@ -2,11 +2,12 @@
 
 from .arxiv_client import ArxivClient
 from .pdf_processor import PDFProcessor
-from .base_retriever import BaseRetriever, LiteratureItem
+from .base_retriever import BaseRetriever, LiteratureItem, LiteratureItemFast
 
 __all__ = [
     "ArxivClient",
     "PDFProcessor",
     "BaseRetriever",
     "LiteratureItem",
+    "LiteratureItemFast",
 ]
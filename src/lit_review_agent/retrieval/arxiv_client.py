@@ -1,13 +1,23 @@
 """ArXiv API client for literature retrieval."""
 
 import asyncio
+import functools
+import os
 import re
-from datetime import datetime
-from typing import List, Optional
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional, Set
 
 import arxiv
 from ..utils.logger import LoggerMixin
-from .base_retriever import BaseRetriever, LiteratureItem
+from .base_retriever import BaseRetriever, LiteratureItem, LiteratureItemFast
+
+# Set LIT_VALIDATE=1 to run full Pydantic validation on converted results
+VALIDATE_ITEMS = os.getenv("LIT_VALIDATE") == "1"
 
 
 class ArxivClient(BaseRetriever, LoggerMixin):
@@ -58,27 +68,124 @@ class ArxivClient(BaseRetriever, LoggerMixin):
         "效果": "effectiveness"
     }
 
-    def __init__(self, max_results: int = 100, **kwargs):
+    # 常见的中文连接词和泛化词，翻译后替换为空格
+    CHINESE_STOPWORDS = (
+        "的", "在", "中", "与", "和", "或", "关于", "对于", "基于", "通过", "使用",
+        "采用", "研究", "分析", "方法", "技术", "算法", "模型", "系统", "应用", "实现",
+        "设计", "开发", "提出", "改进", "优化", "评估", "实验", "结果", "效果", "性能",
+        "比较", "讨论", "总结", "结论",
+    )
+
+    # 关键词翻译优先于停用词；按长度降序构建交替式，保证"卷积神经网络"先于"神经网络"匹配
+    _ZH_TABLE = {
+        **{stopword: " " for stopword in CHINESE_STOPWORDS},
+        **CHINESE_TO_ENGLISH,
+    }
+    _ZH_PATTERN = re.compile(
+        "|".join(re.escape(term) for term in sorted(_ZH_TABLE, key=len, reverse=True))
+    )
+    _CJK_PATTERN = re.compile("[\u4e00-\u9fff]")
+
+    # 限流/服务端错误时请求间隔的指数退避上限（秒）
+    MAX_BACKOFF_DELAY = 60.0
+    _THROTTLE_STATUSES = frozenset({403, 429})
+
+    # 单次检索的总超时（秒），给ArXiv API足够时间
+    SEARCH_TIMEOUT = 45
+
+    # 进程内结果缓存：LRU 容量与过期时间（秒）
+    RESULT_CACHE_SIZE = 256
+    RESULT_CACHE_TTL = 900
+
+    # ID 批量查询：单次请求的最大 ID 数与 get_by_id 的合并等待窗口（秒）
+    ID_BATCH_SIZE = 100
+    ID_BATCH_WINDOW = 0.02
+    _VERSION_SUFFIX = re.compile(r"v\d+$")
+
+    # 模拟数据主题：(主题词集合, ((标题, 作者), ...))
+    _MOCK_TOPICS = (
+        (frozenset({"machine", "learning"}), (
+            ("Deep Learning Advances in Neural Networks",
+             ("Smith, J.", "Johnson, A.", "Brown, K.")),
+            ("Reinforcement Learning for Autonomous Systems",
+             ("Davis, M.", "Wilson, R.")),
+            ("Transfer Learning in Computer Vision",
+             ("Garcia, L.", "Martinez, C.", "Lopez, D.")),
+        )),
+        (frozenset({"quantum", "computing"}), (
+            ("Quantum Algorithms for Optimization Problems",
+             ("Chen, W.", "Zhang, Y.", "Liu, X.")),
+            ("Quantum Error Correction in NISQ Devices",
+             ("Anderson, P.", "Taylor, S.")),
+            ("Quantum Machine Learning Applications",
+             ("Kumar, R.", "Patel, N.", "Singh, A.")),
+        )),
+        (frozenset({"artificial", "intelligence"}), (
+            ("Explainable AI in Healthcare Applications",
+             ("Thompson, E.", "White, M.")),
+            ("Large Language Models and Reasoning",
+             ("Lee, H.", "Kim, J.", "Park, S.")),
+            ("AI Ethics and Fairness in Decision Making",
+             ("Miller, D.", "Jones, B.", "Clark, R.")),
+        )),
+    )
+
+    def __init__(
+        self,
+        max_results: int = 100,
+        max_workers: int = 4,
+        delay_seconds: float = 3.0,
+        page_size: int = 100,
+        num_retries: int = 3,
+        **kwargs,
+    ):
         """
         Initialize the ArXiv client.
 
         Args:
             max_results: Default maximum results per query
+            max_workers: Size of the dedicated thread pool for blocking ArXiv I/O
+            delay_seconds: Base delay between ArXiv API requests
+            page_size: Results fetched per ArXiv API request
+            num_retries: Retries for failed ArXiv API requests
             **kwargs: Additional configuration
         """
         super().__init__(**kwargs)
         self.max_results = max_results
+        self.delay_seconds = delay_seconds
+
+        # Dedicated pool so ArXiv I/O does not compete with the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="arxiv-io"
+        )
+
+        # In-process LRU/TTL caches and per-key locks for request coalescing
+        self._search_cache: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._id_cache: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight_locks: Dict[Hashable, asyncio.Lock] = {}
+        # Callers holding or waiting on each in-flight lock
+        self._inflight_users: Dict[Hashable, int] = {}
 
-        # Configure ArXiv client with better timeout and retry settings
+        # Pending get_by_id calls, flushed together as one batched ID lookup
+        self._pending_ids: Dict[str, List[asyncio.Future]] = {}
+        self._pending_flush: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+        # Configure ArXiv client; delay_seconds is raised temporarily on throttling
         self.client = arxiv.Client(
-            page_size=100,  # Fetch more results per request
-            delay_seconds=3,  # Respect rate limits
-            num_retries=3  # Retry failed requests
+            page_size=page_size,
+            delay_seconds=delay_seconds,
+            num_retries=num_retries,
         )
 
         self.logger.info(
             f"Initialized ArXiv client with max_results={max_results}, "
-            f"page_size=100, delay=3s, retries=3")
+            f"page_size={page_size}, delay={delay_seconds}s, retries={num_retries}")
+
+    async def aclose(self) -> None:
+        """Shut down the dedicated ArXiv I/O thread pool."""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        self.logger.info("ArXiv client executor shut down")
 
     def get_source_name(self) -> str:
         """Get the source name."""
@@ -97,39 +204,133 @@ class ArxivClient(BaseRetriever, LoggerMixin):
         if not query or not isinstance(query, str):
             return query
 
-        # 检查是否包含中文字符
-        has_chinese = any('\u4e00' <= char <= '\u9fff' for char in query)
-        if not has_chinese:
+        # 检查是否包含中文字符；纯 ASCII 查询（isascii 为 O(1)）直接返回
+        if query.isascii() or not self._CJK_PATTERN.search(query):
             return query
 
-        # 记录原始查询
-        self.logger.info(f"Translating Chinese query: '{query}'")
-
-        # 简单的关键词替换翻译
-        translated_query = query
-        for chinese, english in self.CHINESE_TO_ENGLISH.items():
-            if chinese in translated_query:
-                translated_query = translated_query.replace(chinese, english)
-                self.logger.info(f"Replaced '{chinese}' with '{english}'")
+        # 记录原始查询（loguru 延迟格式化，未启用 DEBUG 时不构造消息）
+        self.logger.debug("Translating Chinese query: '{}'", query)
 
-        # 移除常见的中文连接词和标点
-        chinese_stopwords = ["的", "在", "中", "与", "和", "或", "关于", "对于", "基于", "通过", "使用", "采用", "研究", "分析", "方法", "技术", "算法",
-                             "模型", "系统", "应用", "实现", "设计", "开发", "提出", "改进", "优化", "评估", "实验", "结果", "效果", "性能", "比较", "分析", "讨论", "总结", "结论"]
-        for stopword in chinese_stopwords:
-            translated_query = translated_query.replace(stopword, " ")
-
-        # 清理多余的空格
-        translated_query = " ".join(translated_query.split())
+        translated_query = self._translate_terms(query)
+        self.logger.opt(lazy=True).debug(
+            "Replaced terms: {}", lambda: self._ZH_PATTERN.findall(query))
 
         # 如果翻译后为空或只有标点，使用默认查询
         if not translated_query.strip() or len(translated_query.strip()) < 3:
             translated_query = "machine learning"
             self.logger.warning(
-                f"Translation resulted in empty query, using default: '{translated_query}'")
+                "Translation resulted in empty query, using default: '{}'",
+                translated_query)
 
-        self.logger.info(f"Final translated query: '{translated_query}'")
+        self.logger.debug("Final translated query: '{}'", translated_query)
         return translated_query
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _translate_terms(query: str) -> str:
+        """
+        翻译查询中的中文关键词并移除停用词（纯函数，按查询字符串缓存）
+
+        Args:
+            query: 包含中文的查询字符串
+
+        Returns:
+            清理空格后的翻译结果，可能为空字符串
+        """
+        # 单次扫描完成关键词翻译与停用词移除
+        translated_query = ArxivClient._ZH_PATTERN.sub(
+            lambda match: ArxivClient._ZH_TABLE[match.group(0)], query
+        )
+
+        # 清理多余的空格
+        return " ".join(translated_query.split())
+
+    def _cache_get(self, cache: "OrderedDict[Hashable, tuple]", key: Hashable) -> Any:
+        """
+        Return a fresh cached value (refreshing its LRU position) or None.
+
+        Cached items are stored as immutable snapshots; each hit returns new
+        LiteratureItem instances so callers cannot mutate shared state.
+        """
+        entry = cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.RESULT_CACHE_TTL:
+            del cache[key]
+            return None
+
+        cache.move_to_end(key)
+        if isinstance(value, LiteratureItemFast):
+            return value.to_pydantic(validate=VALIDATE_ITEMS)
+        return [item.to_pydantic(validate=VALIDATE_ITEMS) for item in value]
+
+    def _cache_put(
+        self, cache: "OrderedDict[Hashable, tuple]", key: Hashable, value: Any
+    ) -> None:
+        """Store a value, evicting the least recently used entries beyond capacity."""
+        if isinstance(value, LiteratureItem):
+            value = LiteratureItemFast.from_item(value)
+        else:
+            value = tuple(LiteratureItemFast.from_item(item) for item in value)
+
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > self.RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _is_throttle_error(self, error: Exception) -> bool:
+        """Whether an ArXiv error signals rate limiting or server overload."""
+        if isinstance(error, arxiv.UnexpectedEmptyPageError):
+            return True
+        status = getattr(error, "status", None)
+        return isinstance(status, int) and (
+            status in self._THROTTLE_STATUSES or status >= 500)
+
+    def _record_api_outcome(self, error: Optional[Exception] = None) -> None:
+        """
+        Adapt the request delay: double it on throttling errors (capped at
+        MAX_BACKOFF_DELAY) and halve it back towards the base on success.
+        """
+        current = self.client.delay_seconds
+        if error is not None and self._is_throttle_error(error):
+            backoff = min(max(current * 2, 1.0), self.MAX_BACKOFF_DELAY)
+            self.client.delay_seconds = backoff
+            self.logger.warning(
+                f"ArXiv throttling detected ({error}), delay raised to {backoff:.1f}s")
+        elif error is None and current > self.delay_seconds:
+            self.client.delay_seconds = max(self.delay_seconds, current / 2)
+
+    def _inflight_lock(self, key: Hashable) -> asyncio.Lock:
+        """
+        Get the lock that coalesces concurrent identical upstream requests.
+
+        Every call must be paired with :meth:`_release_inflight_lock`.
+        """
+        lock = self._inflight_locks.get(key)
+        if lock is None:
+            lock = self._inflight_locks[key] = asyncio.Lock()
+        self._inflight_users[key] = self._inflight_users.get(key, 0) + 1
+        return lock
+
+    def _release_inflight_lock(self, key: Hashable, lock: asyncio.Lock) -> None:
+        """
+        Drop a coalescing lock once no caller holds or waits on it, so the
+        lock table does not grow unbounded.
+
+        ``lock.locked()`` is not enough: release() clears it before a queued
+        waiter re-acquires the lock, and a new caller would then get a fresh
+        lock and run the same request in parallel.
+        """
+        users = self._inflight_users[key] - 1
+        if users:
+            self._inflight_users[key] = users
+            return
+        del self._inflight_users[key]
+        if self._inflight_locks.get(key) is lock:
+            del self._inflight_locks[key]
+
     async def search(
         self,
         query: str,
@@ -168,33 +369,44 @@ class ArxivClient(BaseRetriever, LoggerMixin):
                         f"Searching ArXiv: query='{query}', max_results={max_results}"
                     )
 
-            # Create search object
-            search = arxiv.Search(
-                query=query,
-                max_results=min(max_results, self.max_results),
-                sort_by=sort_by,
-                sort_order=sort_order,
-            )
+            effective_max_results = min(max_results, self.max_results)
+            cache_key = (query, effective_max_results, sort_by.value, sort_order.value)
+
+            cached_items = self._cache_get(self._search_cache, cache_key)
+            if cached_items is not None:
+                self.logger.info(
+                    f"ArXiv cache hit: query='{query}', {len(cached_items)} papers")
+                return cached_items
+
+            lock_key = ("search", cache_key)
+            lock = self._inflight_lock(lock_key)
+            try:
+                async with lock:
+                    # An identical concurrent request may have filled the cache
+                    cached_items = self._cache_get(self._search_cache, cache_key)
+                    if cached_items is not None:
+                        return cached_items
+
+                    # Create search object
+                    search = arxiv.Search(
+                        query=query,
+                        max_results=effective_max_results,
+                        sort_by=sort_by,
+                        sort_order=sort_order,
+                    )
 
-            # Execute search with timeout
-            def search_arxiv():
-                try:
-                    return list(self.client.results(search))
-                except Exception as e:
-                    self.logger.error(f"ArXiv API error: {e}")
-                    return []
-
-            loop = asyncio.get_event_loop()
-            results = await asyncio.wait_for(
-                loop.run_in_executor(None, search_arxiv),
-                timeout=45  # 45秒超时，给ArXiv API足够时间
-            )
+                    # Execute search with timeout
+                    status: Dict[str, bool] = {}
+                    literature_items = [
+                        item async for item in self._stream_results(search, status)
+                    ]
 
-            # Convert to LiteratureItem objects
-            literature_items = []
-            for result in results:
-                item = self._convert_arxiv_result(result)
-                literature_items.append(item)
+                    # Results cut short by a swallowed API error are partial;
+                    # only cache a search that ran to completion
+                    if literature_items and status.get("complete"):
+                        self._cache_put(self._search_cache, cache_key, literature_items)
+            finally:
+                self._release_inflight_lock(lock_key, lock)
 
             self.logger.info(
                 f"Retrieved {len(literature_items)} papers from ArXiv")
@@ -202,15 +414,126 @@ class ArxivClient(BaseRetriever, LoggerMixin):
 
         except asyncio.TimeoutError:
             self.logger.error("ArXiv search timed out")
-            raise Exception("ArXiv search timed out after 45 seconds")
+            raise Exception(
+                f"ArXiv search timed out after {self.SEARCH_TIMEOUT} seconds")
         except Exception as e:
             self.logger.error(f"Error searching ArXiv: {e}")
             raise Exception(f"ArXiv search failed: {e}")
 
+    async def search_iter(
+        self,
+        query: str,
+        max_results: int = 10,
+        sort_by: arxiv.SortCriterion = arxiv.SortCriterion.Relevance,
+        sort_order: arxiv.SortOrder = arxiv.SortOrder.Descending,
+        **kwargs,
+    ) -> AsyncIterator[LiteratureItem]:
+        """
+        Search ArXiv and yield papers as soon as each result page arrives.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+            sort_by: Sort criterion
+            sort_order: Sort order
+            **kwargs: Additional search parameters
+
+        Yields:
+            Literature items in ArXiv result order
+        """
+        query = self.translate_chinese_query(query)
+        effective_max_results = min(max_results, self.max_results)
+        cache_key = (query, effective_max_results, sort_by.value, sort_order.value)
+
+        cached_items = self._cache_get(self._search_cache, cache_key)
+        if cached_items is not None:
+            for item in cached_items:
+                yield item
+            return
+
+        self.logger.info(
+            f"Streaming ArXiv search: query='{query}', max_results={max_results}")
+        search = arxiv.Search(
+            query=query,
+            max_results=effective_max_results,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+        streamed_items = []
+        status: Dict[str, bool] = {}
+        async for item in self._stream_results(search, status):
+            streamed_items.append(item)
+            yield item
+
+        # Only a fully consumed stream whose producer finished without an
+        # API error (and before the deadline) is complete enough to cache
+        if streamed_items and status.get("complete"):
+            self._cache_put(self._search_cache, cache_key, streamed_items)
+
+    async def _stream_results(
+        self, search: arxiv.Search, status: Optional[Dict[str, bool]] = None
+    ) -> AsyncIterator[LiteratureItem]:
+        """
+        Run an ArXiv search on the I/O pool and yield converted results as
+        the worker thread produces them.
+
+        API errors end the stream early (they are logged, as before);
+        asyncio.TimeoutError is raised once SEARCH_TIMEOUT elapses.
+
+        Args:
+            search: The ArXiv search to run
+            status: Optional dict; ``status["complete"]`` is set to True once
+                the producer has delivered every result without an error
+        """
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        stop = threading.Event()
+        end_of_stream = object()
+
+        def produce() -> None:
+            try:
+                for result in self.client.results(search):
+                    if stop.is_set():
+                        break
+                    item = self._convert_arxiv_result(result)
+                    loop.call_soon_threadsafe(queue.put_nowait, item)
+                else:
+                    if status is not None:
+                        # Read by the consumer only after end_of_stream, which
+                        # the finally below queues after this store
+                        status["complete"] = True
+                self._record_api_outcome()
+            except Exception as e:
+                self.logger.error(f"ArXiv API error: {e}")
+                self._record_api_outcome(e)
+            finally:
+                try:
+                    loop.call_soon_threadsafe(queue.put_nowait, end_of_stream)
+                except RuntimeError:
+                    pass  # Event loop already closed
+
+        producer = loop.run_in_executor(self._executor, produce)
+        deadline = loop.time() + self.SEARCH_TIMEOUT
+        try:
+            while True:
+                item = await asyncio.wait_for(
+                    queue.get(), timeout=max(0.0, deadline - loop.time()))
+                if item is end_of_stream:
+                    break
+                yield item
+        finally:
+            # Stop the worker after its current page if the consumer went away
+            stop.set()
+            if producer.done():
+                producer.result()
+
     async def get_by_id(self, item_id: str) -> Optional[LiteratureItem]:
         """
         Retrieve a specific paper by ArXiv ID.
 
+        Concurrent calls are collected for a short window and resolved with a
+        single batched lookup via :meth:`get_by_ids`.
+
         Args:
             item_id: ArXiv ID (e.g., '2301.12345')
 
@@ -218,29 +541,128 @@ class ArxivClient(BaseRetriever, LoggerMixin):
             Literature item if found, None otherwise
         """
         try:
-            self.logger.info(f"Retrieving ArXiv paper by ID: {item_id}")
+            cached_item = self._cache_get(self._id_cache, item_id)
+            if cached_item is not None:
+                self.logger.info(f"ArXiv cache hit for paper ID: {item_id}")
+                return cached_item
 
-            # Create search for specific ID
-            search = arxiv.Search(id_list=[item_id])
+            item = await self._enqueue_id(item_id)
 
-            # Execute search asynchronously
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None, lambda: list(self.client.results(search))
-            )
-
-            if results:
-                item = self._convert_arxiv_result(results[0])
-                self.logger.info(f"Found ArXiv paper: {item.title}")
-                return item
-            else:
+            if item is None:
                 self.logger.warning(f"ArXiv paper not found: {item_id}")
                 return None
 
+            self.logger.info(f"Found ArXiv paper: {item.title}")
+            return item
+
         except Exception as e:
             self.logger.error(f"Error retrieving ArXiv paper {item_id}: {e}")
             return None
 
+    async def get_by_ids(self, ids: List[str]) -> Dict[str, LiteratureItem]:
+        """
+        Retrieve several papers by ArXiv ID using batched API requests.
+
+        Args:
+            ids: ArXiv IDs (e.g., ['2301.12345', '2302.00001v2'])
+
+        Returns:
+            Mapping from each requested ID to its literature item; IDs that
+            were not found are omitted
+        """
+        found: Dict[str, LiteratureItem] = {}
+        missing = []
+        for item_id in dict.fromkeys(ids):
+            cached_item = self._cache_get(self._id_cache, item_id)
+            if cached_item is not None:
+                found[item_id] = cached_item
+            else:
+                missing.append(item_id)
+
+        if not missing:
+            return found
+
+        self.logger.info(f"Retrieving {len(missing)} ArXiv papers by ID")
+        loop = asyncio.get_running_loop()
+
+        for start in range(0, len(missing), self.ID_BATCH_SIZE):
+            chunk = missing[start:start + self.ID_BATCH_SIZE]
+            search = arxiv.Search(id_list=chunk, max_results=len(chunk))
+
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, lambda: list(self.client.results(search))
+                )
+                self._record_api_outcome()
+            except Exception as e:
+                self.logger.error(f"Error retrieving ArXiv papers {chunk}: {e}")
+                self._record_api_outcome(e)
+                continue
+
+            # Match results to requested IDs with or without a version suffix.
+            # The short ID keeps the archive prefix of old-style IDs
+            # (hep-th/9901001v1), which item.arxiv_id drops.
+            by_arxiv_id = {}
+            for result in results:
+                item = self._convert_arxiv_result(result)
+                short_id = result.get_short_id()
+                by_arxiv_id[short_id] = item
+                by_arxiv_id.setdefault(self._VERSION_SUFFIX.sub("", short_id), item)
+
+            for item_id in chunk:
+                item = by_arxiv_id.get(item_id) or by_arxiv_id.get(
+                    self._VERSION_SUFFIX.sub("", item_id))
+                if item is not None:
+                    found[item_id] = item
+                    self._cache_put(self._id_cache, item_id, item)
+
+        return found
+
+    def _enqueue_id(self, item_id: str) -> "asyncio.Future":
+        """Queue an ID for the next batched lookup and return its future."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_ids.setdefault(item_id, []).append(future)
+
+        if len(self._pending_ids) >= self.ID_BATCH_SIZE:
+            self._dispatch_pending_ids()
+        elif self._pending_flush is None:
+            self._pending_flush = loop.call_later(
+                self.ID_BATCH_WINDOW, self._dispatch_pending_ids)
+
+        return future
+
+    def _dispatch_pending_ids(self) -> None:
+        """Start a batched lookup for every ID queued so far."""
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+
+        batch, self._pending_ids = self._pending_ids, {}
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._resolve_id_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _resolve_id_batch(self, batch: Dict[str, List[asyncio.Future]]) -> None:
+        """Fetch a batch of IDs and resolve the waiting get_by_id futures."""
+        try:
+            items = await self.get_by_ids(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for item_id, futures in batch.items():
+            item = items.get(item_id)
+            for future in futures:
+                if not future.done():
+                    future.set_result(item)
+
     async def search_by_category(
         self, category: str, max_results: int = 10, **kwargs
     ) -> List[LiteratureItem]:
@@ -290,19 +712,35 @@ class ArxivClient(BaseRetriever, LoggerMixin):
         Returns:
             List of recent literature items
         """
-        # ArXiv doesn't support date filtering in the API directly,
-        # so we'll retrieve more results and filter client-side
-        expanded_results = max_results * 3
-        all_items = await self.search(query, expanded_results, **kwargs)
+        # Let the API filter by submission date so only recent papers are fetched
+        now = datetime.now(timezone.utc)
+        cutoff_date = now - timedelta(days=days)
+        date_clause = (
+            f"submittedDate:[{cutoff_date.strftime('%Y%m%d%H%M')} "
+            f"TO {now.strftime('%Y%m%d%H%M')}]"
+        )
+        query = self.translate_chinese_query(query)
 
-        # Filter by date
-        cutoff_date = datetime.utcnow()
-        cutoff_date = cutoff_date.replace(day=cutoff_date.day - days)
+        recent_items = await self.search(
+            f"({query}) AND {date_clause}", max_results, **kwargs)
+        if recent_items:
+            return recent_items[:max_results]
 
+        # Fall back to over-fetching and filtering client-side
+        self.logger.info(
+            "Date-restricted ArXiv query returned no results, filtering client-side")
+        all_items = await self.search(query, max_results * 3, **kwargs)
         recent_items = self.filter_by_date(all_items, start_date=cutoff_date)
 
         return recent_items[:max_results]
 
+    @staticmethod
+    def _make_item(**fields: Any) -> LiteratureItem:
+        """Build a LiteratureItem from trusted data, skipping validation by default."""
+        if VALIDATE_ITEMS:
+            return LiteratureItem(**fields)
+        return LiteratureItem.model_construct(**fields)
+
     def _convert_arxiv_result(self, arxiv_result) -> LiteratureItem:
         """
         Convert ArXiv result to LiteratureItem.
@@ -323,7 +761,7 @@ class ArxivClient(BaseRetriever, LoggerMixin):
         categories = [str(cat) for cat in arxiv_result.categories]
 
         # Create LiteratureItem
-        return LiteratureItem(
+        return self._make_item(
             id=f"arxiv:{arxiv_id}",
             title=arxiv_result.title,
             authors=authors,
@@ -347,9 +785,7 @@ class ArxivClient(BaseRetriever, LoggerMixin):
                     else None
                 ),
                 "links": (
-                    [str(link) for link in arxiv_result.links]
-                    if arxiv_result.links
-                    else []
+                    tuple(map(str, arxiv_result.links)) if arxiv_result.links else ()
                 ),
             },
         )
@@ -365,44 +801,13 @@ class ArxivClient(BaseRetriever, LoggerMixin):
         Returns:
             模拟的文献项目列表
         """
-        from datetime import datetime, timezone
-        import uuid
-
         mock_papers = []
 
-        # 基于查询生成相关的模拟论文
-        topics = {
-            "machine learning": [
-                ("Deep Learning Advances in Neural Networks",
-                 ["Smith, J.", "Johnson, A.", "Brown, K."]),
-                ("Reinforcement Learning for Autonomous Systems",
-                 ["Davis, M.", "Wilson, R."]),
-                ("Transfer Learning in Computer Vision", [
-                 "Garcia, L.", "Martinez, C.", "Lopez, D."]),
-            ],
-            "quantum computing": [
-                ("Quantum Algorithms for Optimization Problems",
-                 ["Chen, W.", "Zhang, Y.", "Liu, X."]),
-                ("Quantum Error Correction in NISQ Devices",
-                 ["Anderson, P.", "Taylor, S."]),
-                ("Quantum Machine Learning Applications",
-                 ["Kumar, R.", "Patel, N.", "Singh, A."]),
-            ],
-            "artificial intelligence": [
-                ("Explainable AI in Healthcare Applications",
-                 ["Thompson, E.", "White, M."]),
-                ("Large Language Models and Reasoning",
-                 ["Lee, H.", "Kim, J.", "Park, S."]),
-                ("AI Ethics and Fairness in Decision Making",
-                 ["Miller, D.", "Jones, B.", "Clark, R."]),
-            ]
-        }
-
-        # 选择相关主题
+        # 选择相关主题（查询词与主题词有交集即匹配）
         selected_topics = []
-        query_lower = query.lower()
-        for topic, papers in topics.items():
-            if any(word in query_lower for word in topic.split()):
+        query_words = set(query.lower().split())
+        for topic_words, papers in self._MOCK_TOPICS:
+            if not topic_words.isdisjoint(query_words):
                 selected_topics.extend(papers)
 
         # 如果没有匹配的主题，使用通用主题
@@ -425,7 +830,7 @@ class ArxivClient(BaseRetriever, LoggerMixin):
                 authors = [f"Author{i+1}, X.", f"Researcher{i+1}, Y."]
 
             # 生成模拟ID
-            mock_id = f"mock:{uuid.uuid4().hex[:8]}"
+            mock_id = f"mock:{secrets.token_hex(4)}"
 
             # 生成模拟摘要
             abstract = f"This paper presents a comprehensive study on {query}. " \
@@ -435,10 +840,10 @@ class ArxivClient(BaseRetriever, LoggerMixin):
                 f"advancement of {query} research and open new avenues for future work."
 
             # 创建模拟的LiteratureItem
-            mock_paper = LiteratureItem(
+            mock_paper = self._make_item(
                 id=mock_id,
                 title=title,
-                authors=authors,
+                authors=list(authors),
                 abstract=abstract,
                 publication_date=datetime.now(timezone.utc),
                 journal="arXiv preprint",
@@ -1,10 +1,28 @@
 """Base classes and data models for literature retrieval."""
 
+import asyncio
+import sys
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _days_since(now: datetime, date: datetime) -> int:
+    """Whole days from ``date`` to the aware ``now``; naive dates are taken as UTC."""
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return (now - date).days
 
 
 class LiteratureItem(BaseModel):
@@ -13,22 +31,22 @@ class LiteratureItem(BaseModel):
     id: str = Field(..., description="Unique identifier for the item")
     title: str = Field(..., description="Title of the literature item")
     authors: List[str] = Field(default_factory=list, description="List of author names")
-    abstract: Optional[str] = Field(None, description="Abstract or summary")
-    full_text: Optional[str] = Field(None, description="Full text content if available")
+    abstract: Optional[str] = Field(default=None, description="Abstract or summary")
+    full_text: Optional[str] = Field(default=None, description="Full text content if available")
 
     # Publication details
-    journal: Optional[str] = Field(None, description="Journal or venue name")
-    publication_date: Optional[datetime] = Field(None, description="Publication date")
-    volume: Optional[str] = Field(None, description="Volume number")
-    issue: Optional[str] = Field(None, description="Issue number")
-    pages: Optional[str] = Field(None, description="Page numbers")
+    journal: Optional[str] = Field(default=None, description="Journal or venue name")
+    publication_date: Optional[datetime] = Field(default=None, description="Publication date")
+    volume: Optional[str] = Field(default=None, description="Volume number")
+    issue: Optional[str] = Field(default=None, description="Issue number")
+    pages: Optional[str] = Field(default=None, description="Page numbers")
 
     # Identifiers
-    doi: Optional[str] = Field(None, description="Digital Object Identifier")
-    arxiv_id: Optional[str] = Field(None, description="arXiv identifier")
-    pmid: Optional[str] = Field(None, description="PubMed identifier")
-    url: Optional[str] = Field(None, description="URL to the paper")
-    pdf_url: Optional[str] = Field(None, description="Direct PDF URL")
+    doi: Optional[str] = Field(default=None, description="Digital Object Identifier")
+    arxiv_id: Optional[str] = Field(default=None, description="arXiv identifier")
+    pmid: Optional[str] = Field(default=None, description="PubMed identifier")
+    url: Optional[str] = Field(default=None, description="URL to the paper")
+    pdf_url: Optional[str] = Field(default=None, description="Direct PDF URL")
 
     # Categories and tags
     categories: List[str] = Field(
@@ -37,7 +55,7 @@ class LiteratureItem(BaseModel):
     keywords: List[str] = Field(default_factory=list, description="Keywords or tags")
 
     # Metrics
-    citation_count: Optional[int] = Field(None, description="Number of citations")
+    citation_count: Optional[int] = Field(default=None, description="Number of citations")
 
     # Metadata
     source: str = Field(
@@ -50,10 +68,10 @@ class LiteratureItem(BaseModel):
         default_factory=dict, description="Additional metadata"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() if v else None}
+    @field_serializer("publication_date", "retrieved_at", when_used="json")
+    def serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
+        """Serialize datetimes as ISO 8601 strings in JSON output."""
+        return value.isoformat() if value else None
 
     @property
     def author_string(self) -> str:
@@ -72,6 +90,16 @@ class LiteratureItem(BaseModel):
         """Get publication year."""
         return self.publication_date.year if self.publication_date else None
 
+    @cached_property
+    def _title_tokens(self) -> FrozenSet[str]:
+        """Lower-cased title tokens, computed once per item for relevance scoring."""
+        return frozenset(self.title.lower().split()) if self.title else frozenset()
+
+    @cached_property
+    def _abstract_tokens(self) -> FrozenSet[str]:
+        """Lower-cased abstract tokens, computed once per item for relevance scoring."""
+        return frozenset(self.abstract.lower().split()) if self.abstract else frozenset()
+
     def to_citation(self, style: str = "apa") -> str:
         """
         Generate a citation string.
@@ -95,6 +123,68 @@ class LiteratureItem(BaseModel):
         return f"{self.author_string}. {self.title}. {self.journal or 'Unknown'}. {self.year or 'Unknown'}."
 
 
+@dataclass(frozen=True, **_SLOTS)
+class LiteratureItemFast:
+    """
+    Compact, immutable in-memory form of a LiteratureItem.
+
+    Used where many items are held for a long time (e.g. result caches);
+    list fields are stored as tuples. Convert with :meth:`from_item` and
+    :meth:`to_pydantic` at boundaries that need the Pydantic model.
+    """
+
+    id: str
+    title: str
+    source: str
+    authors: Tuple[str, ...] = ()
+    abstract: Optional[str] = None
+    full_text: Optional[str] = None
+    journal: Optional[str] = None
+    publication_date: Optional[datetime] = None
+    volume: Optional[str] = None
+    issue: Optional[str] = None
+    pages: Optional[str] = None
+    doi: Optional[str] = None
+    arxiv_id: Optional[str] = None
+    pmid: Optional[str] = None
+    url: Optional[str] = None
+    pdf_url: Optional[str] = None
+    categories: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
+    citation_count: Optional[int] = None
+    retrieved_at: datetime = field(default_factory=datetime.utcnow)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    _SEQUENCE_FIELDS: ClassVar[Tuple[str, ...]] = ("authors", "categories", "keywords")
+
+    @classmethod
+    def from_item(cls, item: LiteratureItem) -> "LiteratureItemFast":
+        """Create a compact copy of a LiteratureItem."""
+        data = {f.name: getattr(item, f.name) for f in fields(cls)}
+        for name in cls._SEQUENCE_FIELDS:
+            data[name] = tuple(data[name])
+        data["metadata"] = dict(data["metadata"])
+        return cls(**data)
+
+    def to_pydantic(self, validate: bool = True) -> LiteratureItem:
+        """
+        Convert back to a LiteratureItem.
+
+        Args:
+            validate: Run Pydantic validation; disable for trusted data
+
+        Returns:
+            A new, independent LiteratureItem
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        for name in self._SEQUENCE_FIELDS:
+            data[name] = list(data[name])
+        data["metadata"] = dict(data["metadata"])
+        if validate:
+            return LiteratureItem(**data)
+        return LiteratureItem.model_construct(**data)
+
+
 class BaseRetriever(ABC):
     """Abstract base class for literature retrievers."""
 
@@ -143,29 +233,43 @@ class BaseRetriever(ABC):
         pass
 
     async def search_multiple_queries(
-        self, queries: List[str], max_results_per_query: int = 10
+        self,
+        queries: List[str],
+        max_results_per_query: int = 10,
+        max_concurrency: int = 3,
     ) -> List[LiteratureItem]:
         """
-        Search for multiple queries and combine results.
+        Search for multiple queries concurrently and combine results.
 
         Args:
             queries: List of search queries
             max_results_per_query: Maximum results per query
+            max_concurrency: Maximum number of queries in flight at once
 
         Returns:
             Combined list of literature items
         """
-        all_items = []
-        seen_ids = set()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def search_one(query: str) -> List[LiteratureItem]:
+            async with semaphore:
+                return await self.search(query, max_results_per_query)
 
-        for query in queries:
-            items = await self.search(query, max_results_per_query)
+        results_lists = await asyncio.gather(
+            *(search_one(query) for query in queries), return_exceptions=True
+        )
+
+        # Keyed by id; dicts preserve insertion order, so first-seen wins
+        merged: Dict[str, LiteratureItem] = {}
+
+        for query, items in zip(queries, results_lists):
+            if isinstance(items, BaseException):
+                logger.error(f"Search failed for query '{query}': {items}")
+                continue
             for item in items:
-                if item.id not in seen_ids:
-                    all_items.append(item)
-                    seen_ids.add(item.id)
+                merged.setdefault(item.id, item)
 
-        return all_items
+        return list(merged.values())
 
     def filter_by_date(
         self,
@@ -214,29 +318,28 @@ class BaseRetriever(ABC):
             Sorted list of items
         """
         # Simple relevance scoring based on query terms in title and abstract
-        query_terms = set(query.lower().split())
-
-        def relevance_score(item: LiteratureItem) -> float:
-            score = 0.0
-
-            # Check title
-            if item.title:
-                title_terms = set(item.title.lower().split())
-                score += len(query_terms.intersection(title_terms)) * 2.0
-
-            # Check abstract
-            if item.abstract:
-                abstract_terms = set(item.abstract.lower().split())
-                score += len(query_terms.intersection(abstract_terms)) * 1.0
+        query_terms = frozenset(query.lower().split())
+        # Aware, like the dates ArXiv returns; naive dates are taken as UTC
+        now = datetime.now(timezone.utc)
+
+        # Invariants are bound as defaults so lookups inside are local-variable fast
+        def relevance_score(
+            item: LiteratureItem, _terms=query_terms, _now=now, _max=max, _min=min
+        ) -> float:
+            # Check title and abstract
+            score = len(_terms & item._title_tokens) * 2.0
+            score += len(_terms & item._abstract_tokens) * 1.0
 
             # Boost recent papers
-            if item.publication_date:
-                years_old = (datetime.utcnow() - item.publication_date).days / 365.25
-                score += max(0, 5 - years_old) * 0.1
+            publication_date = item.publication_date
+            if publication_date:
+                years_old = _days_since(_now, publication_date) / 365.25
+                score += _max(0, 5 - years_old) * 0.1
 
             # Boost highly cited papers
-            if item.citation_count:
-                score += min(item.citation_count / 100.0, 2.0)
+            citation_count = item.citation_count
+            if citation_count:
+                score += _min(citation_count / 100.0, 2.0)
 
             return score
 
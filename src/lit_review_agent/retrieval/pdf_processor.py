@@ -1,78 +1,329 @@
 """PDF processor for extracting text from PDF documents."""
 
 import asyncio
+import io
+import os
+import re
+import shutil
 import tempfile
-from pathlib import Path
-from typing import Optional
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, BinaryIO, List, Optional, Tuple, Union
 
 import httpx
-from pypdf import PdfReader
-from pdfminer.high_level import extract_text
 
+from ..utils.cache_manager import get_cache_manager
 from ..utils.logger import LoggerMixin
 from ..utils.helpers import clean_text
 
 
+# Worker-side helpers. These run inside the process pool, so they live at
+# module level and take a path or raw bytes (both picklable) as the source.
+# The PDF libraries are imported here rather than at the top of the module,
+# so only the worker processes pay their import cost, and only once a PDF
+# is actually parsed.
+def _open_source(source: Union[str, bytes]) -> BinaryIO:
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    return open(source, "rb")
+
+
+def _pdfium_extract(source: Union[str, bytes]) -> str:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source)
+    try:
+        texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "\n".join(texts)
+    finally:
+        pdf.close()
+
+
+def _pdfminer_extract(source: Union[str, bytes]) -> str:
+    from pdfminer.high_level import extract_text
+
+    with _open_source(source) as file:
+        return extract_text(file)
+
+
+def _pypdf_page_count(source: Union[str, bytes]) -> int:
+    from pypdf import PdfReader
+
+    with _open_source(source) as file:
+        return len(PdfReader(file).pages)
+
+
+def _pypdf_extract_pages(
+    source: Union[str, bytes], start: int, stop: int
+) -> List[str]:
+    from pypdf import PdfReader
+
+    # Each worker opens its own reader: PdfReader is not safe to share
+    with _open_source(source) as file:
+        reader = PdfReader(file)
+        texts = []
+        for page in reader.pages[start:stop]:
+            try:
+                texts.append(page.extract_text() or "")
+            except Exception:
+                # Skip unreadable pages but continue with the rest
+                texts.append("")
+        return texts
+
+
 class PDFProcessor(LoggerMixin):
     """Processor for extracting text from PDF documents."""
 
+    # Download chunk size and temp-file write buffer size (bytes)
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    WRITE_BUFFER_SIZE = 1024 * 1024
+    # Downloads up to this size are parsed in memory; larger ones spill to disk
+    IN_MEMORY_LIMIT = 50 * 1024 * 1024
+    # Worker processes for CPU-bound parsing (workers are spawned lazily)
+    PARSE_WORKERS = min(4, os.cpu_count() or 1)
+    # Documents with fewer pages are extracted by pypdf in a single worker
+    MIN_PAGES_PER_WORKER = 8
+    # Content types that can never be a PDF (e.g. HTML error or landing pages).
+    # Others, such as application/octet-stream, are judged by the %PDF header.
+    _NON_PDF_CONTENT_TYPES = ("text/", "application/json", "application/xml", "image/")
+    # Extracted text is cached per URL; failed URLs are remembered for a shorter time
+    TEXT_CACHE_TTL = 86400
+    FAILURE_CACHE_TTL = 3600
+    # HTTP statuses that mean the document is gone, not temporarily unavailable
+    _PERMANENT_HTTP_STATUSES = frozenset({404, 410})
+    # URLs ending in .pdf (optionally with a query/fragment) or with a /pdf/ path
+    _PDF_URL_PATTERN = re.compile(
+        r"\.pdf(?:$|[?#])|arxiv\.org/pdf|/pdf/", re.IGNORECASE
+    )
+
     def __init__(self):
         """Initialize the PDF processor."""
+        # pdfminer/pypdf hold the GIL and PDFium is not thread-safe, so parsing
+        # runs in worker processes rather than the default thread pool
+        self._process_pool = ProcessPoolExecutor(max_workers=self.PARSE_WORKERS)
+        # One pooled HTTP/2 client for all downloads, so repeated fetches from
+        # the same host reuse connections instead of a new TCP+TLS handshake
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
         self.logger.info("Initialized PDF processor")
 
+    async def __aenter__(self) -> "PDFProcessor":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and shut down the PDF parsing process pool."""
+        await self._client.aclose()
+        await asyncio.to_thread(self._process_pool.shutdown, wait=True)
+        self.logger.info("PDF processor closed")
+
     async def extract_text_from_url(self, pdf_url: str) -> Optional[str]:
         """
         Extract text from a PDF at the given URL.
 
+        Results are cached per URL, including definitive failures (404/410,
+        a non-PDF response or a document that cannot be parsed), so known-bad
+        URLs are not downloaded again until the failure entry expires.
+        Rate limits, server errors and network problems are not cached.
+
         Args:
             pdf_url: URL to the PDF file
 
         Returns:
             Extracted text or None if extraction fails
         """
+        cache = get_cache_manager()
+        cache_key = {"op": "pdf_extract", "url": pdf_url}
+
+        cached = cache.get(cache_key, cache_type="pdf_text", ttl=self.TEXT_CACHE_TTL)
+        if isinstance(cached, str):
+            self.logger.debug(f"Using cached PDF text for: {pdf_url}")
+            return cached
+        if (
+            isinstance(cached, dict)
+            and cached.get("_fail")
+            and time.time() - cached.get("at", 0) <= self.FAILURE_CACHE_TTL
+        ):
+            self.logger.info(f"Skipping PDF that recently failed: {pdf_url}")
+            return None
+
         try:
-            self.logger.info(f"Downloading PDF from: {pdf_url}")
+            text = await self._download_and_extract(pdf_url)
+        except httpx.HTTPStatusError as e:
+            self.logger.error(
+                f"Error extracting text from PDF URL {pdf_url}: {e}")
+            if e.response.status_code not in self._PERMANENT_HTTP_STATUSES:
+                # Rate limits and server errors are worth retrying later
+                return None
+            text = None
+        except Exception as e:
+            # Network problems, timeouts and local errors are not a verdict
+            # on the URL itself; don't remember them as failures
+            self.logger.error(
+                f"Error extracting text from PDF URL {pdf_url}: {e}")
+            return None
 
-            # Download the PDF asynchronously
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(pdf_url)
+        if text:
+            cache.set(cache_key, text, cache_type="pdf_text")
+        else:
+            failure = {"_fail": True, "at": time.time()}
+            cache.set(cache_key, failure, cache_type="pdf_text")
+        return text
+
+    async def _download_and_extract(self, pdf_url: str) -> Optional[str]:
+        """Download a PDF and extract its text; HTTP errors propagate."""
+        self.logger.info(f"Downloading PDF from: {pdf_url}")
+
+        # Typical papers are buffered in memory and handed to the workers as
+        # bytes. Downloads past IN_MEMORY_LIMIT move to a named temporary
+        # file, so workers get its path and nothing large is pickled.
+        buffer = bytearray()
+        spill: Optional[IO[bytes]] = None
+        received = 0
+        try:
+            async with self._client.stream("GET", pdf_url) as response:
                 response.raise_for_status()
 
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-                temp_file.write(response.content)
-                temp_path = temp_file.name
+                content_type = response.headers.get("content-type", "").lower()
+                if content_type.startswith(self._NON_PDF_CONTENT_TYPES):
+                    self.logger.warning(
+                        f"Not a PDF ({content_type}), skipping: {pdf_url}")
+                    return None
+
+                async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                    # Check the magic bytes before buffering anything
+                    if not received and b"%PDF" not in chunk[:1024]:
+                        self.logger.warning(
+                            f"Response is not a PDF document, skipping: {pdf_url}")
+                        return None
+                    received += len(chunk)
+                    if spill is None and received > self.IN_MEMORY_LIMIT:
+                        # Disk writes are kept off the event loop
+                        spill = await asyncio.to_thread(self._open_spill_file)
+                        await asyncio.to_thread(spill.write, buffer)
+                        # Free the in-memory copy; the file holds it now
+                        buffer.clear()
+                    if spill is not None:
+                        await asyncio.to_thread(spill.write, chunk)
+                    else:
+                        buffer += chunk
+
+            if spill is not None:
+                await asyncio.to_thread(spill.close)
+                return await self._extract_source(spill.name, pdf_url)
+            return await self._extract_source(bytes(buffer), pdf_url)
+        finally:
+            if spill is not None:
+                spill.close()
+                try:
+                    os.unlink(spill.name)
+                except OSError:
+                    pass
+
+    def _open_spill_file(self) -> IO[bytes]:
+        """Create the named temporary file a large download is written to."""
+        return tempfile.NamedTemporaryFile(
+            suffix=".pdf", delete=False, buffering=self.WRITE_BUFFER_SIZE
+        )
 
-            try:
-                # Extract text from the temporary file
-                text = await self.extract_text_from_file(temp_path)
-                return text
-            finally:
-                # Clean up temporary file
-                Path(temp_path).unlink(missing_ok=True)
+    def _materialize_stream(self, stream: BinaryIO) -> Tuple[Union[str, bytes], bool]:
+        """
+        Turn a stream into a source the worker processes can take.
+
+        Small streams are read into bytes. Larger ones are copied to a named
+        temporary file whose path is returned, together with True to tell
+        the caller to delete it afterwards.
+        """
+        stream.seek(0, io.SEEK_END)
+        size = stream.tell()
+        stream.seek(0)
+        if size <= self.IN_MEMORY_LIMIT:
+            return stream.read(), False
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            shutil.copyfileobj(stream, tmp, self.WRITE_BUFFER_SIZE)
+        return tmp.name, True
+
+    async def extract_text_from_file(
+        self, file_path: Union[str, BinaryIO]
+    ) -> Optional[str]:
+        """
+        Extract text from a local PDF file.
+
+        Args:
+            file_path: Path to the PDF file, or a seekable binary stream
 
+        Returns:
+            Extracted text or None if extraction fails
+        """
+        if isinstance(file_path, str):
+            return await self._extract_source(file_path, file_path)
+
+        temp_path = None
+        try:
+            source, is_temp = await asyncio.to_thread(
+                self._materialize_stream, file_path
+            )
+            if is_temp:
+                temp_path = source
+            return await self._extract_source(source, "<in-memory PDF>")
         except Exception as e:
-            self.logger.error(
-                f"Error extracting text from PDF URL {pdf_url}: {e}")
+            self.logger.error(f"Error reading PDF stream: {e}")
             return None
-
-    async def extract_text_from_file(self, file_path: str) -> Optional[str]:
+        finally:
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    async def _extract_source(
+        self, source: Union[str, bytes], source_name: str
+    ) -> Optional[str]:
         """
-        Extract text from a local PDF file.
+        Extract text from a path or raw bytes in the worker processes.
 
         Args:
-            file_path: Path to the PDF file
+            source: Path to the PDF file or its raw bytes (both picklable)
+            source_name: Name used in log messages
 
         Returns:
             Extracted text or None if extraction fails
         """
         try:
-            self.logger.info(f"Extracting text from PDF file: {file_path}")
+            self.logger.info(f"Extracting text from PDF file: {source_name}")
+
+            loop = asyncio.get_running_loop()
 
-            # Try pdfminer first (usually more accurate) - run in executor for async
+            # Try pypdfium2 first (native PDFium, much faster than pure Python)
             try:
-                loop = asyncio.get_event_loop()
-                text = await loop.run_in_executor(None, extract_text, file_path)
+                text = await loop.run_in_executor(
+                    self._process_pool, _pdfium_extract, source
+                )
+                if text and text.strip():
+                    cleaned_text = clean_text(text)
+                    self.logger.info(
+                        f"Extracted {len(cleaned_text)} characters using pypdfium2"
+                    )
+                    return cleaned_text
+            except Exception as e:
+                self.logger.warning(
+                    f"pypdfium2 extraction failed: {e}, trying pdfminer")
+
+            # Fall back to pdfminer
+            try:
+                text = await loop.run_in_executor(
+                    self._process_pool, _pdfminer_extract, source
+                )
                 if text and text.strip():
                     cleaned_text = clean_text(text)
                     self.logger.info(
@@ -83,26 +334,9 @@ class PDFProcessor(LoggerMixin):
                 self.logger.warning(
                     f"pdfminer extraction failed: {e}, trying pypdf")
 
-            # Fallback to pypdf - also run in executor for async
+            # Fallback to pypdf, splitting the pages across worker processes
             try:
-
-                def _extract_with_pypdf2(file_path):
-                    with open(file_path, "rb") as file:
-                        reader = PdfReader(file)
-                        text = ""
-
-                        for page in reader.pages:
-                            try:
-                                page_text = page.extract_text()
-                                if page_text:
-                                    text += page_text + "\n"
-                            except Exception:
-                                # Log but continue with other pages
-                                pass
-                        return text
-
-                loop = asyncio.get_event_loop()
-                text = await loop.run_in_executor(None, _extract_with_pypdf2, file_path)
+                text = await self._extract_with_pypdf(source)
 
                 if text and text.strip():
                     cleaned_text = clean_text(text)
@@ -115,14 +349,43 @@ class PDFProcessor(LoggerMixin):
                 self.logger.error(f"pypdf extraction failed: {e}")
 
             self.logger.error(
-                f"All PDF extraction methods failed for: {file_path}")
+                f"All PDF extraction methods failed for: {source_name}")
             return None
 
         except Exception as e:
             self.logger.error(
-                f"Error extracting text from PDF file {file_path}: {e}")
+                f"Error extracting text from PDF file {source_name}: {e}")
             return None
 
+    async def _extract_with_pypdf(self, source: Union[str, bytes]) -> str:
+        """
+        Extract text with pypdf, processing page ranges in parallel.
+
+        Args:
+            source: Path to the PDF file or its raw bytes
+
+        Returns:
+            Text of all pages joined by newlines
+        """
+        loop = asyncio.get_running_loop()
+        page_count = await loop.run_in_executor(
+            self._process_pool, _pypdf_page_count, source
+        )
+        workers = max(
+            1, min(self.PARSE_WORKERS, page_count // self.MIN_PAGES_PER_WORKER)
+        )
+        step = -(-page_count // workers) if page_count else 1
+
+        ranges = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._process_pool, _pypdf_extract_pages, source, start, start + step
+                )
+                for start in range(0, page_count, step)
+            )
+        )
+        return "\n".join(text for texts in ranges for text in texts if text)
+
     async def extract_text_from_bytes(self, pdf_bytes: bytes) -> Optional[str]:
         """
         Extract text from PDF bytes.
@@ -133,22 +396,8 @@ class PDFProcessor(LoggerMixin):
         Returns:
             Extracted text or None if extraction fails
         """
-        try:
-            # Save bytes to temporary file and extract
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-                temp_file.write(pdf_bytes)
-                temp_path = temp_file.name
-
-            try:
-                text = await self.extract_text_from_file(temp_path)
-                return text
-            finally:
-                # Clean up temporary file
-                Path(temp_path).unlink(missing_ok=True)
-
-        except Exception as e:
-            self.logger.error(f"Error extracting text from PDF bytes: {e}")
-            return None
+        # Bytes are already a picklable worker source; no copy needed
+        return await self._extract_source(pdf_bytes, "<in-memory PDF>")
 
     def is_valid_pdf_url(self, url: str) -> bool:
         """
@@ -160,13 +409,4 @@ class PDFProcessor(LoggerMixin):
         Returns:
             True if URL appears to be a PDF
         """
-        if not url:
-            return False
-
-        # Simple heuristics
-        url_lower = url.lower()
-        return (
-            url_lower.endswith(".pdf")
-            or "pdf" in url_lower
-            or "arxiv.org/pdf" in url_lower
-        )
+        return bool(url) and self._PDF_URL_PATTERN.search(url) is not None
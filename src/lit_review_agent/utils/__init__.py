@@ -1,19 +1,22 @@
 """Utility modules for the literature review agent."""
 
-from .config import Config
+from .config import Config, get_config
 from .logger import setup_logger
 from .helpers import (
     clean_text,
     extract_keywords,
+    extract_keywords_batch,
     validate_email,
     safe_filename,
 )
 
 __all__ = [
     "Config",
+    "get_config",
     "setup_logger",
     "clean_text",
     "extract_keywords",
+    "extract_keywords_batch",
     "validate_email",
     "safe_filename",
 ]
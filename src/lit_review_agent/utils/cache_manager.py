@@ -1,33 +1,117 @@
 """Cache manager for improving performance and reducing API calls."""
 
-import hashlib
-import json
+import asyncio
+import functools
+import math
+import os
+import queue
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, Union
 import pickle
 
+import msgpack
+import orjson
+import xxhash
+
 from .logger import LoggerMixin
 
 
+# One-byte format markers written at the start of every cache file
+_JSON_MAGIC = b"J"
+_PICKLE_MAGIC = b"P"
+
+# Scalar types orjson writes and reads back unchanged (floats are also
+# checked for finiteness: orjson writes NaN/inf as null)
+_JSON_SCALARS = (str, int, bool, type(None))
+
+
+def _json_round_trips(value: Any) -> bool:
+    """Return True if orjson would load ``value`` back exactly as it was."""
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(_json_round_trips(v) for v in value)
+    if value_type is dict:
+        return all(
+            type(k) is str and _json_round_trips(v) for k, v in value.items()
+        )
+    # Tuples, sets, subclasses, datetimes, dataclasses, ... go through pickle
+    return False
+
+
+def _serialize(value: Any) -> bytes:
+    """Serialize with orjson when the value round-trips exactly, pickle otherwise."""
+    if _json_round_trips(value):
+        try:
+            return _JSON_MAGIC + orjson.dumps(value)
+        except TypeError:
+            # e.g. integers outside the 64-bit range
+            pass
+    return _PICKLE_MAGIC + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _deserialize(data: bytes) -> Any:
+    """Inverse of _serialize, dispatching on the leading format marker."""
+    magic, payload = data[:1], data[1:]
+    if magic == _JSON_MAGIC:
+        return orjson.loads(payload)
+    if magic == _PICKLE_MAGIC:
+        return pickle.loads(payload)
+    raise ValueError(f"unknown cache format marker {magic!r}")
+
+
+def _sort_key(item: Tuple[Any, Any]) -> Tuple[str, Any]:
+    """Order dict items by key type name, then key, so mixed key types compare."""
+    key = item[0]
+    return type(key).__name__, key
+
+
+def _canonicalize(data: Any) -> Any:
+    """Sort dict keys recursively so equal keys always pack to the same bytes."""
+    if isinstance(data, dict):
+        try:
+            items = sorted(data.items(), key=_sort_key)
+        except TypeError:
+            # Keys of one type that don't order (e.g. None, tuples of mixed
+            # types): fall back to their reprs, which always compare
+            items = sorted(data.items(), key=lambda item: repr(item[0]))
+        return {k: _canonicalize(v) for k, v in items}
+    if isinstance(data, (list, tuple)):
+        return [_canonicalize(v) for v in data]
+    return data
+
+
 class CacheManager(LoggerMixin):
     """
     A simple file-based cache manager for storing API responses and computed results.
     
     Features:
     - TTL (Time To Live) support
-    - JSON and pickle serialization
+    - orjson serialization with pickle fallback for non-JSON values
     - Automatic cache cleanup
+    - In-process LRU layer of serialized payloads in front of the disk cache
     - Thread-safe operations
     """
     
-    def __init__(self, cache_dir: str = "./data/cache", default_ttl: int = 3600):
+    # Maximum total payload size held in the in-memory LRU layer
+    MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+    
+    def __init__(self, cache_dir: str = "./data/cache", default_ttl: int = 3600,
+                 evict_batch_size: int = 100, evict_pause_ms: int = 50):
         """
         Initialize cache manager.
         
         Args:
             cache_dir: Directory to store cache files
             default_ttl: Default time to live in seconds (1 hour)
+            evict_batch_size: Max stale files removed per background batch
+            evict_pause_ms: Pause between background eviction batches
         """
         super().__init__()
         self.cache_dir = Path(cache_dir)
@@ -39,28 +123,128 @@ class CacheManager(LoggerMixin):
         (self.cache_dir / "embeddings").mkdir(exist_ok=True)
         (self.cache_dir / "search_results").mkdir(exist_ok=True)
         
+        # Shard directories already known to exist (skips mkdir on every set)
+        self._known_shards: Set[Path] = set()
+        
+        # (cache_type, cache_key) -> (payload, stored_at); guarded by _mem_lock.
+        # Payloads are kept serialized so callers never share (and mutate)
+        # a cached object, and so the layer can be bounded by size.
+        self._mem: "OrderedDict[Tuple[str, str], Tuple[bytes, float]]" = OrderedDict()
+        self._mem_bytes = 0
+        self._mem_lock = threading.Lock()
+        
+        # Stale files found by get() are removed off the hot path by a
+        # daemon thread, started on first use
+        self.evict_batch_size = evict_batch_size
+        self.evict_pause_ms = evict_pause_ms
+        self._evict_q: "queue.SimpleQueue[Tuple[Path, float]]" = queue.SimpleQueue()
+        self._evict_thread: Optional[threading.Thread] = None
+        self._evict_thread_lock = threading.Lock()
+        
         self.logger.info(f"Cache manager initialized with directory: {self.cache_dir}")
     
     def _generate_key(self, data: Union[str, Dict[str, Any]]) -> str:
         """Generate a unique cache key from data."""
         if isinstance(data, str):
-            content = data
+            content = data.encode()
         else:
-            content = json.dumps(data, sort_keys=True)
+            content = msgpack.packb(_canonicalize(data), default=str)
         
-        return hashlib.md5(content.encode()).hexdigest()
+        # Non-cryptographic 128-bit hash; same hex length as the old MD5 keys
+        return xxhash.xxh3_128_hexdigest(content)
     
     def _get_cache_path(self, key: str, cache_type: str = "general") -> Path:
-        """Get the full path for a cache file."""
-        return self.cache_dir / cache_type / f"{key}.cache"
+        """Get the full path for a cache file, sharded by the key's first two hex chars."""
+        return self.cache_dir / cache_type / key[:2] / f"{key[2:]}.cache"
     
-    def _is_expired(self, cache_path: Path, ttl: int) -> bool:
-        """Check if a cache file has expired."""
-        if not cache_path.exists():
-            return True
-        
-        file_age = time.time() - cache_path.stat().st_mtime
-        return file_age > ttl
+    def _ensure_shard(self, cache_path: Path) -> None:
+        """Create the shard directory for a cache file on first use."""
+        shard_dir = cache_path.parent
+        if shard_dir not in self._known_shards:
+            shard_dir.mkdir(parents=True, exist_ok=True)
+            self._known_shards.add(shard_dir)
+    
+    def _scan_cache_files(self, cache_dir: Path) -> Iterator[os.DirEntry]:
+        """Yield ``*.cache`` entries of a cache directory and its shard subdirectories."""
+        try:
+            with os.scandir(cache_dir) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            return
+        
+        for entry in entries:
+            if entry.is_dir():
+                yield from self._scan_cache_files(Path(entry.path))
+            elif entry.name.endswith(".cache") and entry.is_file():
+                yield entry
+    
+    def _mem_get(self, mem_key: Tuple[str, str], ttl: int) -> Optional[bytes]:
+        """Look up a payload in the memory layer, dropping it if it has expired."""
+        with self._mem_lock:
+            entry = self._mem.get(mem_key)
+            if entry is None:
+                return None
+            payload, stored_at = entry
+            if time.time() - stored_at > ttl:
+                del self._mem[mem_key]
+                self._mem_bytes -= len(payload)
+                return None
+            self._mem.move_to_end(mem_key)
+            return payload
+    
+    def _mem_put(self, mem_key: Tuple[str, str], payload: bytes, stored_at: float) -> None:
+        """Insert a payload, evicting least recently used entries over the size budget."""
+        with self._mem_lock:
+            old = self._mem.pop(mem_key, None)
+            if old is not None:
+                self._mem_bytes -= len(old[0])
+            if len(payload) > self.MEMORY_CACHE_BYTES:
+                return
+            self._mem[mem_key] = (payload, stored_at)
+            self._mem_bytes += len(payload)
+            while self._mem_bytes > self.MEMORY_CACHE_BYTES:
+                _, (evicted, _) = self._mem.popitem(last=False)
+                self._mem_bytes -= len(evicted)
+    
+    def _mem_discard(self, mem_key: Tuple[str, str]) -> None:
+        """Remove an entry from the memory layer if present."""
+        with self._mem_lock:
+            entry = self._mem.pop(mem_key, None)
+            if entry is not None:
+                self._mem_bytes -= len(entry[0])
+    
+    def _schedule_eviction(self, cache_path: Path, mtime: float) -> None:
+        """Queue a stale cache file for removal by the background evictor."""
+        if self._evict_thread is None:
+            with self._evict_thread_lock:
+                if self._evict_thread is None:
+                    self._evict_thread = threading.Thread(
+                        target=self._evict_worker, name="cache-evictor", daemon=True
+                    )
+                    self._evict_thread.start()
+        self._evict_q.put((cache_path, mtime))
+    
+    def _evict_worker(self) -> None:
+        """Drain the eviction queue in batches, pausing between batches."""
+        while True:
+            batch = [self._evict_q.get()]
+            while len(batch) < self.evict_batch_size:
+                try:
+                    batch.append(self._evict_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for cache_path, mtime in batch:
+                try:
+                    # Skip files rewritten by set() since they were queued
+                    if cache_path.stat().st_mtime == mtime:
+                        cache_path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    self.logger.warning(f"Failed to evict cache file {cache_path}: {e}")
+            
+            time.sleep(self.evict_pause_ms / 1000)
     
     def get(self, key: Union[str, Dict[str, Any]], cache_type: str = "general", 
             ttl: Optional[int] = None) -> Optional[Any]:
@@ -78,23 +262,36 @@ class CacheManager(LoggerMixin):
         cache_key = self._generate_key(key)
         cache_path = self._get_cache_path(cache_key, cache_type)
         ttl = ttl or self.default_ttl
+        mem_key = (cache_type, cache_key)
+        
+        payload = self._mem_get(mem_key, ttl)
+        if payload is not None:
+            # Each hit deserializes a fresh copy
+            return _deserialize(payload)
         
-        if self._is_expired(cache_path, ttl):
-            if cache_path.exists():
-                cache_path.unlink()  # Remove expired cache
+        try:
+            stored_at = cache_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        
+        if time.time() - stored_at > ttl:
+            self._schedule_eviction(cache_path, stored_at)  # Remove expired cache
             return None
         
         try:
             with open(cache_path, 'rb') as f:
-                data = pickle.load(f)
+                payload = f.read()
+            data = _deserialize(payload)
             
+            self._mem_put(mem_key, payload, stored_at)
             self.logger.debug(f"Cache hit for key: {cache_key[:8]}...")
             return data
             
-        except (FileNotFoundError, pickle.PickleError, EOFError) as e:
+        except FileNotFoundError:
+            return None
+        except (pickle.PickleError, EOFError, ValueError) as e:
             self.logger.warning(f"Failed to load cache for key {cache_key[:8]}...: {e}")
-            if cache_path.exists():
-                cache_path.unlink()  # Remove corrupted cache
+            self._schedule_eviction(cache_path, stored_at)  # Remove corrupted cache
             return None
     
     def set(self, key: Union[str, Dict[str, Any]], value: Any, 
@@ -115,13 +312,19 @@ class CacheManager(LoggerMixin):
         cache_path = self._get_cache_path(cache_key, cache_type)
         
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(value, f)
+            self._ensure_shard(cache_path)
+            payload = _serialize(value)
+            # Unbuffered: the payload is written with a single syscall
+            with open(cache_path, 'wb', buffering=0) as f:
+                f.write(payload)
             
+            self._mem_put((cache_type, cache_key), payload, time.time())
             self.logger.debug(f"Cached value for key: {cache_key[:8]}...")
             return True
             
         except (OSError, pickle.PickleError) as e:
+            # The shard may have been removed externally; re-check next time
+            self._known_shards.discard(cache_path.parent)
             self.logger.error(f"Failed to cache value for key {cache_key[:8]}...: {e}")
             return False
     
@@ -138,6 +341,7 @@ class CacheManager(LoggerMixin):
         """
         cache_key = self._generate_key(key)
         cache_path = self._get_cache_path(cache_key, cache_type)
+        self._mem_discard((cache_type, cache_key))
         
         if cache_path.exists():
             cache_path.unlink()
@@ -156,17 +360,17 @@ class CacheManager(LoggerMixin):
         Returns:
             Number of files deleted
         """
-        cache_dir = self.cache_dir / cache_type
-        if not cache_dir.exists():
-            return 0
+        with self._mem_lock:
+            for mem_key in [k for k in self._mem if k[0] == cache_type]:
+                self._mem_bytes -= len(self._mem.pop(mem_key)[0])
         
         deleted_count = 0
-        for cache_file in cache_dir.glob("*.cache"):
+        for entry in self._scan_cache_files(self.cache_dir / cache_type):
             try:
-                cache_file.unlink()
+                os.unlink(entry.path)
                 deleted_count += 1
             except OSError as e:
-                self.logger.warning(f"Failed to delete cache file {cache_file}: {e}")
+                self.logger.warning(f"Failed to delete cache file {entry.path}: {e}")
         
         self.logger.info(f"Cleared {deleted_count} cache files from {cache_type}")
         return deleted_count
@@ -188,17 +392,20 @@ class CacheManager(LoggerMixin):
         else:
             cache_dirs = [d for d in self.cache_dir.iterdir() if d.is_dir()]
         
+        # Files modified before this instant have outlived the default TTL
+        cutoff = time.time() - self.default_ttl
+        
         for cache_dir in cache_dirs:
-            if not cache_dir.exists():
-                continue
-                
-            for cache_file in cache_dir.glob("*.cache"):
-                if self._is_expired(cache_file, self.default_ttl):
-                    try:
-                        cache_file.unlink()
+            # DirEntry caches its stat result: one syscall per file
+            for entry in self._scan_cache_files(cache_dir):
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
                         deleted_count += 1
-                    except OSError as e:
-                        self.logger.warning(f"Failed to delete expired cache file {cache_file}: {e}")
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    self.logger.warning(f"Failed to delete expired cache file {entry.path}: {e}")
         
         if deleted_count > 0:
             self.logger.info(f"Cleaned up {deleted_count} expired cache files")
@@ -224,15 +431,21 @@ class CacheManager(LoggerMixin):
         
         for cache_dir in self.cache_dir.iterdir():
             if cache_dir.is_dir():
-                cache_files = list(cache_dir.glob("*.cache"))
-                cache_size = sum(f.stat().st_size for f in cache_files)
+                file_count = 0
+                cache_size = 0
+                for entry in self._scan_cache_files(cache_dir):
+                    try:
+                        cache_size += entry.stat().st_size
+                    except FileNotFoundError:
+                        continue
+                    file_count += 1
                 
                 stats["cache_types"][cache_dir.name] = {
-                    "files": len(cache_files),
+                    "files": file_count,
                     "size_mb": round(cache_size / (1024 * 1024), 2)
                 }
                 
-                total_files += len(cache_files)
+                total_files += file_count
                 total_size += cache_size
         
         stats["total_files"] = total_files
@@ -253,40 +466,70 @@ def get_cache_manager() -> CacheManager:
     return _cache_manager
 
 
-def cache_api_response(func):
+def _cached_call(func, cache_type: str, ttl: Optional[int] = None):
     """
-    Decorator to cache API responses.
+    Wrap a sync or async function so its results are cached.
     
-    Usage:
-        @cache_api_response
-        async def api_call(param1, param2):
-            # API call logic
-            return response
+    Coroutine functions get an async wrapper that caches the awaited result
+    rather than the coroutine object.
     """
+    name = f"{func.__module__}.{func.__qualname__}"
+    
+    def make_key(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Arguments go to _generate_key as-is; it packs them canonically
+        return {"function": name, "args": list(args), "kwargs": kwargs}
+    
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def awrapper(*args, **kwargs):
+            cache = get_cache_manager()
+            cache_key = make_key(args, kwargs)
+            
+            # Try to get from cache first
+            cached_result = cache.get(cache_key, cache_type=cache_type, ttl=ttl)
+            if cached_result is not None:
+                return cached_result
+            
+            # Await the call and cache the resolved result
+            result = await func(*args, **kwargs)
+            cache.set(cache_key, result, cache_type=cache_type, ttl=ttl)
+            
+            return result
+        
+        return awrapper
+    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         cache = get_cache_manager()
-        
-        # Create cache key from function name and arguments
-        cache_key = {
-            "function": func.__name__,
-            "args": str(args),
-            "kwargs": str(sorted(kwargs.items()))
-        }
+        cache_key = make_key(args, kwargs)
         
         # Try to get from cache first
-        cached_result = cache.get(cache_key, cache_type="api_responses")
+        cached_result = cache.get(cache_key, cache_type=cache_type, ttl=ttl)
         if cached_result is not None:
             return cached_result
         
         # Call the function and cache the result
         result = func(*args, **kwargs)
-        cache.set(cache_key, result, cache_type="api_responses")
+        cache.set(cache_key, result, cache_type=cache_type, ttl=ttl)
         
         return result
     
     return wrapper
 
 
+def cache_api_response(func):
+    """
+    Decorator to cache API responses.
+    
+    Usage:
+        @cache_api_response
+        async def api_call(param1, param2):
+            # API call logic
+            return response
+    """
+    return _cached_call(func, cache_type="api_responses")
+
+
 def cache_embeddings(func):
     """
     Decorator to cache embedding computations.
@@ -297,25 +540,4 @@ def cache_embeddings(func):
             # Embedding computation logic
             return embeddings
     """
-    def wrapper(*args, **kwargs):
-        cache = get_cache_manager()
-        
-        # Create cache key from function name and arguments
-        cache_key = {
-            "function": func.__name__,
-            "args": str(args),
-            "kwargs": str(sorted(kwargs.items()))
-        }
-        
-        # Try to get from cache first
-        cached_result = cache.get(cache_key, cache_type="embeddings", ttl=7200)  # 2 hours TTL
-        if cached_result is not None:
-            return cached_result
-        
-        # Call the function and cache the result
-        result = func(*args, **kwargs)
-        cache.set(cache_key, result, cache_type="embeddings", ttl=7200)
-        
-        return result
-    
-    return wrapper
+    return _cached_call(func, cache_type="embeddings", ttl=7200)  # 2 hours TTL
@@ -1,13 +1,27 @@
 """Configuration management for the literature review agent."""
 
+import functools
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Literal, List
+from typing import Any, ClassVar, Dict, Optional, Literal, List, Set
 
 from pydantic import Field, ConfigDict
 from pydantic_settings import BaseSettings
 from loguru import logger
 
 
+@functools.lru_cache(maxsize=1)
+def _find_env_file() -> str:
+    """Locate the environment file once; the result is reused by every Config."""
+    env_path = Path(".env")
+    if env_path.exists():
+        return str(env_path.absolute())
+    config_env_path = Path("config/.env")
+    if config_env_path.exists():
+        return str(config_env_path.absolute())
+    return "No .env file found"
+
+
 class Config(BaseSettings):
     """Application configuration with environment variable support."""
 
@@ -15,6 +29,7 @@ class Config(BaseSettings):
         env_file="config/config.env",
         case_sensitive=False,
         extra="allow",  # Allow extra fields for testing and flexibility
+        populate_by_name=True,  # Accept field names as well as env aliases
     )
 
     # Core Settings
@@ -104,6 +119,10 @@ class Config(BaseSettings):
         default="http://export.arxiv.org/api/", validation_alias="ARXIV_API_URL"
     )
     arxiv_max_results: int = Field(default=100, validation_alias="ARXIV_MAX_RESULTS")
+    arxiv_delay_seconds: float = Field(
+        default=3.0, validation_alias="ARXIV_DELAY_SECONDS"
+    )  # Base delay between ArXiv API requests
+    arxiv_page_size: int = Field(default=100, validation_alias="ARXIV_PAGE_SIZE")
     arxiv_query_prefix: Optional[str] = Field(
         default=None, validation_alias="ARXIV_QUERY_PREFIX"
     )
@@ -162,19 +181,11 @@ class Config(BaseSettings):
     output_dir: str = Field(default="./data/outputs", validation_alias="OUTPUT_DIR")
     report_format: str = Field(default="markdown", validation_alias="REPORT_FORMAT")
 
-    def __init__(self, **kwargs):
-        """Initialize configuration, loading from .env file if it exists."""
-        # Store kwargs for later override
-        override_values = kwargs.copy()
-
-        super().__init__(**kwargs)
-
-        # Override with explicitly passed values (for testing)
-        for key, value in override_values.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+    # Absolute paths of directories already created by any Config instance
+    _dirs_created: ClassVar[Set[str]] = set()
 
-        # Validate critical configuration
+    def model_post_init(self, __context: Any) -> None:
+        """Validate critical settings and create directories after loading."""
         if not self.deepseek_api_key and self.llm_provider == "deepseek":
             logger.warning(
                 "DeepSeek API key not found. Some features may not work properly."
@@ -194,7 +205,11 @@ class Config(BaseSettings):
         ]
 
         for directory in directories:
+            resolved = os.path.abspath(directory)
+            if resolved in Config._dirs_created:
+                continue
             directory.mkdir(parents=True, exist_ok=True)
+            Config._dirs_created.add(resolved)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -208,13 +223,7 @@ class Config(BaseSettings):
 
     def env_file_location(self) -> str:
         """Get the location of the environment file."""
-        env_path = Path(".env")
-        if env_path.exists():
-            return str(env_path.absolute())
-        config_env_path = Path("config/.env")
-        if config_env_path.exists():
-            return str(config_env_path.absolute())
-        return "No .env file found"
+        return _find_env_file()
 
     @property
     def is_development(self) -> bool:
@@ -247,3 +256,9 @@ class Config(BaseSettings):
             "model": self.deepseek_model,
             "api_base": self.deepseek_api_base,
         }
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Get the shared application configuration, loaded on first use."""
+    return Config()
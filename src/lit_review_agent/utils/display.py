@@ -1,10 +1,15 @@
 """Display utilities using Rich library for enhanced CLI experience."""
 
+import platform
 import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
@@ -25,14 +30,111 @@ from rich.layout import Layout
 from rich.align import Align
 from rich.logging import RichHandler
 
+# Platform check done once at import; Windows consoles get ASCII-safe icons
+_IS_WINDOWS = platform.system() == 'Windows'
+
+_TITLE_EMOJI = "[blue]*[/blue]" if _IS_WINDOWS else "[blue]🔬[/blue]"
+_WARN_ICON = "!" if _IS_WINDOWS else "⚠️"
+_ERR_ICON = "X" if _IS_WINDOWS else "❌"
+_SUCCESS_ICON = "+" if _IS_WINDOWS else "✅"
+
 # Global console instance for consistent formatting
 # Fix Windows Unicode encoding issues
-import platform
-if platform.system() == 'Windows':
+if _IS_WINDOWS:
     console = Console(force_terminal=True, legacy_windows=False)
 else:
     console = Console()
 
+@lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """Format a status-line timestamp; formatted once per wall-clock second."""
+    return time.strftime("%H:%M:%S", time.localtime(seconds))
+
+
+# Shared Progress instance, created on first use by _get_progress()
+_progress: Optional[Progress] = None
+
+
+def _get_progress(target: Console) -> Progress:
+    """Return the shared Progress, building its columns on first use."""
+    global _progress
+    if _progress is None:
+        # Use simpler progress bar for Windows to avoid Unicode issues
+        if _IS_WINDOWS:
+            _progress = Progress(
+                TextColumn("[progress.description]{task.description}"),
+                TextColumn("-"),
+                TimeElapsedColumn(),
+                console=target,
+                transient=False,
+            )
+        else:
+            _progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(bar_width=40),
+                MofNCompleteColumn(),
+                TextColumn("•"),
+                TimeElapsedColumn(),
+                TextColumn("•"),
+                TimeRemainingColumn(),
+                console=target,
+                transient=False,
+            )
+    return _progress
+
+
+def _truncate(value: str, limit: int) -> str:
+    """Cut ``value`` to ``limit`` characters, ending with "..." when shortened."""
+    return f"{value[:limit - 3]}..." if len(value) > limit else value
+
+
+def _format_paper_row(index: int, paper: Dict[str, Any]) -> Tuple[str, ...]:
+    """Format one paper as the cells of a papers-table row."""
+    get = paper.get
+
+    title = _truncate(get("title", "N/A"), 47)
+
+    # Format authors
+    authors = get("authors")
+    if authors:
+        authors_str = (
+            ", ".join(authors) if len(authors) <= 2 else f"{authors[0]}, et al."
+        )
+        authors_str = _truncate(authors_str, 22)
+    else:
+        authors_str = "N/A"
+
+    # Just show year for space: "2023-05-01T..." -> "2023"
+    pub_date = get("published_date", "N/A")
+    if isinstance(pub_date, str) and pub_date and pub_date != "N/A":
+        date_display = pub_date.partition("T")[0].partition("-")[0]
+    else:
+        date_display = "N/A"
+
+    # Format keywords, showing only the first 3
+    keywords = get("keywords")
+    if keywords:
+        keywords_str = ", ".join(keywords[:3])
+        if len(keywords) > 3:
+            keywords_str = f"{keywords_str} (+{len(keywords) - 3})"
+        keywords_str = _truncate(keywords_str, 27)
+    else:
+        keywords_str = "N/A"
+
+    # Full text indicator
+    full_text_icon = "✅" if get("full_text_retrieved", False) else "❌"
+
+    return (
+        str(index),
+        title,
+        authors_str,
+        get("source", "N/A"),
+        date_display,
+        full_text_icon,
+        keywords_str,
+    )
+
 
 class LiteratureReviewDisplay:
     """Enhanced display utilities for literature review operations."""
@@ -54,71 +156,56 @@ class LiteratureReviewDisplay:
             header_content = title
 
         # Create panel with border - use safe characters for Windows
-        title_emoji = "[blue]🔬[/blue]" if platform.system() != 'Windows' else "[blue]*[/blue]"
         panel = Panel(
             Align.center(header_content),
-            title=f"{title_emoji} Literature Review Agent",
+            title=f"{_TITLE_EMOJI} Literature Review Agent",
             title_align="center",
             border_style="bright_blue",
             padding=(1, 2),
         )
 
-        self.console.print()
-        self.console.print(panel)
-        self.console.print()
+        # Blank line, panel, blank line in a single render
+        self.console.print(Group(Text(), panel, Text()))
+
+    @contextmanager
+    def batch_output(self) -> Iterator[None]:
+        """
+        Buffer everything printed inside the block and write it out at once.
+
+        Uses Rich's console buffer, so a burst of status lines or paper
+        details becomes a single write/flush on exit instead of one per line.
+        """
+        with self.console:
+            yield
 
     def print_status(self, message: str, style: str = "bold green") -> None:
         """Print a status message with styling."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = _format_timestamp(int(time.time()))
         self.console.print(
             f"[dim]{timestamp}[/dim] [bold blue]→[/bold blue] [{style}]{message}[/{style}]"
         )
 
     def print_warning(self, message: str) -> None:
         """Print a warning message."""
-        warning_icon = "⚠️" if platform.system() != 'Windows' else "!"
-        self.console.print(f"[bold yellow]{warning_icon} Warning:[/bold yellow] {message}")
+        self.console.print(f"[bold yellow]{_WARN_ICON} Warning:[/bold yellow] {message}")
 
     def print_error(self, message: str) -> None:
         """Print an error message."""
-        error_icon = "❌" if platform.system() != 'Windows' else "X"
-        self.console.print(f"[bold red]{error_icon} Error:[/bold red] {message}")
+        self.console.print(f"[bold red]{_ERR_ICON} Error:[/bold red] {message}")
 
     def print_success(self, message: str) -> None:
         """Print a success message."""
-        success_icon = "✅" if platform.system() != 'Windows' else "+"
-        self.console.print(f"[bold green]{success_icon} Success:[/bold green] {message}")
+        self.console.print(f"[bold green]{_SUCCESS_ICON} Success:[/bold green] {message}")
 
     def create_progress_bar(
         self, description: str, total: Optional[int] = None
     ) -> Progress:
         """Create and return a progress bar."""
         # Stop any existing progress first
-        if self.current_progress:
-            self.current_progress.stop()
+        self.finish_progress()
 
-        # Use simpler progress bar for Windows to avoid Unicode issues
-        if platform.system() == 'Windows':
-            self.current_progress = Progress(
-                TextColumn("[progress.description]{task.description}"),
-                TextColumn("-"),
-                TimeElapsedColumn(),
-                console=self.console,
-                transient=False,
-            )
-        else:
-            self.current_progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(bar_width=40),
-                MofNCompleteColumn(),
-                TextColumn("•"),
-                TimeElapsedColumn(),
-                TextColumn("•"),
-                TimeRemainingColumn(),
-                console=self.console,
-                transient=False,
-            )
+        # The Progress (and its columns) is built once and reused per phase
+        self.current_progress = _get_progress(self.console)
 
         if total:
             self.current_task = self.current_progress.add_task(description, total=total)
@@ -142,7 +229,11 @@ class LiteratureReviewDisplay:
     def finish_progress(self) -> None:
         """Finish and clean up the current progress bar."""
         if self.current_progress:
+            # Stop first so the finished bar stays on screen, then drop the
+            # task; the Progress itself is kept for the next phase
             self.current_progress.stop()
+            if self.current_task is not None:
+                self.current_progress.remove_task(self.current_task)
             self.current_progress = None
             self.current_task = None
 
@@ -168,63 +259,7 @@ class LiteratureReviewDisplay:
 
         # Add rows
         for i, paper in enumerate(papers[:20], 1):  # Limit to first 20 for display
-            # Truncate title if too long
-            title = paper.get("title", "N/A")
-            if len(title) > 47:
-                title = title[:44] + "..."
-
-            # Format authors
-            authors = paper.get("authors", [])
-            if authors:
-                if len(authors) <= 2:
-                    authors_str = ", ".join(authors)
-                else:
-                    authors_str = f"{authors[0]}, et al."
-                if len(authors_str) > 22:
-                    authors_str = authors_str[:19] + "..."
-            else:
-                authors_str = "N/A"
-
-            # Format date
-            pub_date = paper.get("published_date", "N/A")
-            if pub_date and pub_date != "N/A":
-                try:
-                    if "T" in pub_date:  # ISO format
-                        date_part = pub_date.split("T")[0]
-                    else:
-                        date_part = pub_date
-                    # Just show year for space
-                    date_display = (
-                        date_part.split("-")[0] if "-" in date_part else date_part
-                    )
-                except:
-                    date_display = "N/A"
-            else:
-                date_display = "N/A"
-
-            # Format keywords
-            keywords = paper.get("keywords", [])
-            if keywords:
-                keywords_str = ", ".join(keywords[:3])  # Show only first 3
-                if len(keywords) > 3:
-                    keywords_str += f" (+{len(keywords) - 3})"
-                if len(keywords_str) > 27:
-                    keywords_str = keywords_str[:24] + "..."
-            else:
-                keywords_str = "N/A"
-
-            # Full text indicator
-            full_text_icon = "✅" if paper.get("full_text_retrieved", False) else "❌"
-
-            table.add_row(
-                str(i),
-                title,
-                authors_str,
-                paper.get("source", "N/A"),
-                date_display,
-                full_text_icon,
-                keywords_str,
-            )
+            table.add_row(*_format_paper_row(i, paper))
 
         return table
 
@@ -242,18 +277,19 @@ class LiteratureReviewDisplay:
 
         # Add source breakdown if available
         if "processed_papers" in results:
-            sources = {}
-            full_text_count = 0
-            for paper in results["processed_papers"]:
-                source = paper.get("source", "Unknown")
-                sources[source] = sources.get(source, 0) + 1
-                if paper.get("full_text_retrieved", False):
-                    full_text_count += 1
+            papers = results["processed_papers"]
+            sources = Counter(paper.get("source", "Unknown") for paper in papers)
+            full_text_count = sum(
+                1 for paper in papers if paper.get("full_text_retrieved", False)
+            )
 
             summary_lines.append("")
             summary_lines.append("📈 [bold]Source Breakdown:[/bold]")
-            for source, count in sources.items():
-                summary_lines.append(f"   • {source}: {count} papers")
+            # Largest sources first
+            summary_lines.extend(
+                f"   • {source}: {count} papers"
+                for source, count in sources.most_common()
+            )
 
             summary_lines.append(
                 f"📄 [bold]Full Text Retrieved:[/bold] {full_text_count}/{num_papers} papers"
@@ -274,59 +310,61 @@ class LiteratureReviewDisplay:
         title = paper.get("title", "N/A")
         authors = paper.get("authors", [])
 
+        # Collect all parts and render them with a single print call
+        parts: List[Any] = []
+
         # Create header
-        self.console.print(f"\n[bold bright_blue]Paper #{index}:[/bold bright_blue]")
-        self.console.print(Rule(style="dim"))
+        parts.append(f"\n[bold bright_blue]Paper #{index}:[/bold bright_blue]")
+        parts.append(Rule(style="dim"))
 
         # Title
-        self.console.print(f"[bold green]Title:[/bold green] {title}")
+        parts.append(f"[bold green]Title:[/bold green] {title}")
 
         # Authors
         if authors:
             authors_str = ", ".join(authors)
-            self.console.print(f"[bold cyan]Authors:[/bold cyan] {authors_str}")
+            parts.append(f"[bold cyan]Authors:[/bold cyan] {authors_str}")
 
         # Publication info
         pub_date = paper.get("published_date")
         if pub_date:
-            self.console.print(f"[bold yellow]Published:[/bold yellow] {pub_date}")
+            parts.append(f"[bold yellow]Published:[/bold yellow] {pub_date}")
 
         source = paper.get("source")
         if source:
-            self.console.print(f"[bold magenta]Source:[/bold magenta] {source}")
+            parts.append(f"[bold magenta]Source:[/bold magenta] {source}")
 
         # URLs
         url = paper.get("url")
         if url:
-            self.console.print(f"[bold blue]URL:[/bold blue] {url}")
+            parts.append(f"[bold blue]URL:[/bold blue] {url}")
 
         pdf_url = paper.get("pdf_url")
         if pdf_url:
-            self.console.print(f"[bold blue]PDF:[/bold blue] {pdf_url}")
+            parts.append(f"[bold blue]PDF:[/bold blue] {pdf_url}")
 
         # Keywords
         keywords = paper.get("keywords", [])
         if keywords:
             keywords_str = ", ".join(keywords)
-            self.console.print(f"[bold dim]Keywords:[/bold dim] {keywords_str}")
+            parts.append(f"[bold dim]Keywords:[/bold dim] {keywords_str}")
 
         # AI Summary
         ai_summary = paper.get("ai_enhanced_summary")
         if ai_summary and ai_summary != "No text content available for summarization.":
-            self.console.print(
+            parts.append(
                 f"\n[bold bright_green]AI Enhanced Summary:[/bold bright_green]"
             )
             # Create a panel for the summary
-            summary_panel = Panel(ai_summary, border_style="green", padding=(0, 1))
-            self.console.print(summary_panel)
+            parts.append(Panel(ai_summary, border_style="green", padding=(0, 1)))
 
         # Full text info
         if paper.get("full_text_retrieved"):
             snippet = paper.get("full_text_snippet")
             if snippet:
-                self.console.print(
-                    f"\n[bold dim]Full Text Preview:[/bold dim] {snippet}"
-                )
+                parts.append(f"\n[bold dim]Full Text Preview:[/bold dim] {snippet}")
+
+        self.console.print(Group(*parts))
 
     def print_markdown_report(self, markdown_content: str) -> None:
         """Print markdown content with rich formatting."""
@@ -379,12 +417,18 @@ def print_success(message: str) -> None:
         print(f"[SUCCESS] {message}")
 
 
-def get_rich_handler() -> RichHandler:
-    """Get a RichHandler for logging integration."""
+def get_rich_handler(show_locals: bool = False) -> RichHandler:
+    """
+    Get a RichHandler for logging integration.
+
+    Args:
+        show_locals: Render local variables in tracebacks. Capturing locals
+            is expensive, so this is meant for debug runs only.
+    """
     return RichHandler(
         console=console,
         show_time=True,
         show_path=False,
         rich_tracebacks=True,
-        tracebacks_show_locals=True,
+        tracebacks_show_locals=show_locals,
     )
@@ -3,35 +3,110 @@
 import re
 import unicodedata
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import spacy
-from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 
 # Global model cache to avoid reloading models repeatedly
 _SPACY_MODEL_CACHE = {}
 _STOPWORDS_CACHE = {}
 
+# NLTK's English stopword list, embedded so the common case needs no corpus
+# download or disk load
+_ENGLISH_STOPWORDS = frozenset(
+    {
+        "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you",
+        "you're", "you've", "you'll", "you'd", "your", "yours", "yourself",
+        "yourselves", "he", "him", "his", "himself", "she", "she's", "her", "hers",
+        "herself", "it", "it's", "its", "itself", "they", "them", "their", "theirs",
+        "themselves", "what", "which", "who", "whom", "this", "that", "that'll",
+        "these", "those", "am", "is", "are", "was", "were", "be", "been", "being",
+        "have", "has", "had", "having", "do", "does", "did", "doing", "a", "an",
+        "the", "and", "but", "if", "or", "because", "as", "until", "while", "of",
+        "at", "by", "for", "with", "about", "against", "between", "into", "through",
+        "during", "before", "after", "above", "below", "to", "from", "up", "down",
+        "in", "out", "on", "off", "over", "under", "again", "further", "then",
+        "once", "here", "there", "when", "where", "why", "how", "all", "any",
+        "both", "each", "few", "more", "most", "other", "some", "such", "no", "nor",
+        "not", "only", "own", "same", "so", "than", "too", "very", "s", "t", "can",
+        "will", "just", "don", "don't", "should", "should've", "now", "d", "ll",
+        "m", "o", "re", "ve", "y", "ain", "aren", "aren't", "couldn", "couldn't",
+        "didn", "didn't", "doesn", "doesn't", "hadn", "hadn't", "hasn", "hasn't",
+        "haven", "haven't", "isn", "isn't", "ma", "mightn", "mightn't", "mustn",
+        "mustn't", "needn", "needn't", "shan", "shan't", "shouldn", "shouldn't",
+        "wasn", "wasn't", "weren", "weren't", "won", "won't", "wouldn", "wouldn't",
+    }
+)
+
+# spaCy entity labels and POS tags that yield keywords
+_ENT_LABELS = frozenset({"PERSON", "ORG", "GPE", "PRODUCT", "EVENT"})
+_KEEP_POS = frozenset({"NOUN", "PROPN", "ADJ"})
+
+# Lazily loaded tiktoken encoding; False once it is known to be unavailable
+_ENCODING = None
+
+# Precompiled patterns used by the text helpers below
+_WS_RE = re.compile(r"\s+")
+_INVALID_FNAME_RE = re.compile(r'[<>:"/\\|?*]')
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
+_SENT_END_RE = re.compile(r"[.!?] ")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+class _SpecialCharTable(dict):
+    """
+    str.translate table that deletes everything except word characters,
+    whitespace and basic punctuation (same set as [\\w\\s.,;:!?\\-()]).
+
+    Entries are filled in lazily per code point, so only characters that
+    actually occur in processed text are ever stored.
+    """
+
+    _KEEP_PUNCT = frozenset(".,;:!?-()_")
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        keep = char.isalnum() or char.isspace() or char in self._KEEP_PUNCT
+        value = codepoint if keep else None
+        self[codepoint] = value
+        return value
+
+
+_SPECIAL_CHARS_TABLE = _SpecialCharTable()
+
+
+def _get_spacy_model(
+    model_name: str = "en_core_web_sm", disable: Tuple[str, ...] = ("parser",)
+):
+    """
+    Get cached spaCy model or load it if not cached.
 
-def _get_spacy_model(model_name: str = "en_core_web_sm"):
-    """Get cached spaCy model or load it if not cached."""
-    if model_name not in _SPACY_MODEL_CACHE:
+    Keyword extraction only needs POS tags, lemmas and entities, so the
+    dependency parser (the most expensive component) is disabled by default.
+    """
+    cache_key = (model_name, disable)
+    if cache_key not in _SPACY_MODEL_CACHE:
         try:
-            _SPACY_MODEL_CACHE[model_name] = spacy.load(model_name)
+            _SPACY_MODEL_CACHE[cache_key] = spacy.load(model_name, disable=disable)
         except OSError:
             # Model not found, return None
-            _SPACY_MODEL_CACHE[model_name] = None
-    return _SPACY_MODEL_CACHE[model_name]
+            _SPACY_MODEL_CACHE[cache_key] = None
+    return _SPACY_MODEL_CACHE[cache_key]
 
 
 def _get_stopwords(language: str = "english"):
     """Get cached stopwords or load them if not cached."""
+    if language == "english":
+        return _ENGLISH_STOPWORDS
     if language not in _STOPWORDS_CACHE:
         try:
-            _STOPWORDS_CACHE[language] = set(stopwords.words(language))
+            from nltk.corpus import stopwords
+
+            _STOPWORDS_CACHE[language] = frozenset(stopwords.words(language))
         except Exception:
-            _STOPWORDS_CACHE[language] = set()
+            _STOPWORDS_CACHE[language] = frozenset()
     return _STOPWORDS_CACHE[language]
 
 
@@ -49,21 +124,121 @@ def clean_text(text: str, remove_special_chars: bool = True) -> str:
     if not text:
         return ""
 
-    # Normalize unicode characters
-    text = unicodedata.normalize("NFKD", text)
+    # Normalize unicode characters (ASCII text is already NFKD-normalized)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
 
     # Remove extra whitespace and newlines
-    text = re.sub(r"\s+", " ", text)
+    text = _WS_RE.sub(" ", text)
     text = text.strip()
 
     # Remove special characters if requested
     if remove_special_chars:
         # Keep alphanumeric, spaces, and basic punctuation
-        text = re.sub(r"[^\w\s\.\,\;\:\!\?\-\(\)]", "", text)
+        text = text.translate(_SPECIAL_CHARS_TABLE)
 
     return text
 
 
+def _keywords_from_doc(
+    doc,
+    stop_words: FrozenSet[str],
+    custom: FrozenSet[str],
+    max_keywords: int,
+    min_length: int,
+) -> List[str]:
+    """Collect entity and noun/adjective keywords from a processed spaCy doc.
+
+    Duplicates are dropped as they are found, and collection stops as soon as
+    ``max_keywords`` distinct keywords are in hand.
+    """
+    keywords: List[str] = []
+    if max_keywords <= 0:
+        return keywords
+    seen: Set[str] = set()
+    append = keywords.append
+    mark = seen.add
+
+    # Add named entities
+    for ent in doc.ents:
+        if ent.label_ not in _ENT_LABELS:
+            continue
+        text = ent.text
+        if len(text) < min_length:
+            continue
+        lowered = text.lower()
+        if lowered in stop_words or lowered in custom or lowered in seen:
+            continue
+        mark(lowered)
+        append(lowered)
+        if len(keywords) >= max_keywords:
+            return keywords
+
+    # Add important nouns and adjectives; cheap flag and length checks first
+    for token in doc:
+        if token.is_punct or token.is_stop:
+            continue
+        if token.pos_ not in _KEEP_POS:
+            continue
+        text = token.text
+        if len(text) < min_length:
+            continue
+        lowered = text.lower()
+        if lowered in stop_words or lowered in custom:
+            continue
+        lemma = token.lemma_.lower()
+        if lemma in seen:
+            continue
+        mark(lemma)
+        append(lemma)
+        if len(keywords) >= max_keywords:
+            break
+
+    return keywords
+
+
+def _fallback_keywords(
+    text: str,
+    stop_words: FrozenSet[str],
+    custom: FrozenSet[str],
+    max_keywords: int,
+    min_length: int,
+) -> List[str]:
+    """Simple tokenization-based keywords for when spaCy is unavailable."""
+    keywords: List[str] = []
+    if max_keywords <= 0:
+        return keywords
+    seen: Set[str] = set()
+
+    for token in word_tokenize(text.lower()):
+        if (
+            len(token) < min_length
+            or token in seen
+            or not token.isalpha()
+            or token in stop_words
+            or token in custom
+        ):
+            continue
+        seen.add(token)
+        keywords.append(token)
+        if len(keywords) >= max_keywords:
+            break
+
+    return keywords
+
+
+def _keyword_stopwords(
+    custom_stopwords: Optional[Set[str]],
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Cached English stopwords and the caller's custom stopwords.
+
+    The two are checked separately rather than merged, so no per-call copy of
+    the cached set is made and the cache itself is never mutated.
+    """
+    return _get_stopwords("english"), frozenset(custom_stopwords or ())
+
+
 def extract_keywords(
     text: str,
     max_keywords: int = 10,
@@ -85,63 +260,58 @@ def extract_keywords(
     if not text:
         return []
 
-    try:
-        # Get cached spaCy model
-        nlp = _get_spacy_model("en_core_web_sm")
-        if nlp is None:
-            raise OSError("spaCy model not available")
-
-        doc = nlp(text.lower())
-
-        # Get cached stopwords
-        stop_words = _get_stopwords("english")
-        if custom_stopwords:
-            stop_words.update(custom_stopwords)
-
-        # Extract keywords based on POS tags and named entities
-        keywords = []
-
-        # Add named entities
-        for ent in doc.ents:
-            if (
-                ent.label_ in ["PERSON", "ORG", "GPE", "PRODUCT", "EVENT"]
-                and len(ent.text) >= min_length
-                and ent.text.lower() not in stop_words
-            ):
-                keywords.append(ent.text.lower())
-
-        # Add important nouns and adjectives
-        for token in doc:
-            if (
-                token.pos_ in ["NOUN", "PROPN", "ADJ"]
-                and not token.is_stop
-                and not token.is_punct
-                and len(token.text) >= min_length
-                and token.text.lower() not in stop_words
-            ):
-                keywords.append(token.lemma_.lower())
-
-        # Remove duplicates and limit results
-        # Preserve order while removing duplicates
-        keywords = list(dict.fromkeys(keywords))
-        return keywords[:max_keywords]
-
-    except OSError:
+    stop_words, custom = _keyword_stopwords(custom_stopwords)
+
+    # Get cached spaCy model
+    nlp = _get_spacy_model("en_core_web_sm")
+    if nlp is None:
         # Fallback to simple tokenization if spaCy model is not available
-        tokens = word_tokenize(text.lower())
-        stop_words = _get_stopwords("english")
-        if custom_stopwords:
-            stop_words.update(custom_stopwords)
-
-        keywords = [
-            token
-            for token in tokens
-            if (
-                len(token) >= min_length and token.isalpha() and token not in stop_words
-            )
+        return _fallback_keywords(text, stop_words, custom, max_keywords, min_length)
+
+    return _keywords_from_doc(
+        nlp(text.lower()), stop_words, custom, max_keywords, min_length
+    )
+
+
+def extract_keywords_batch(
+    texts: Iterable[str],
+    max_keywords: int = 10,
+    min_length: int = 3,
+    custom_stopwords: Optional[Set[str]] = None,
+    batch_size: int = 64,
+) -> List[List[str]]:
+    """
+    Extract keywords from many texts, streaming them through spaCy in batches.
+
+    Args:
+        texts: Input texts
+        max_keywords: Maximum number of keywords to return per text
+        min_length: Minimum length of keywords
+        custom_stopwords: Additional stopwords to filter out
+        batch_size: Number of texts processed per spaCy batch
+
+    Returns:
+        List of keyword lists, one per input text
+    """
+    texts = list(texts)
+    stop_words, custom = _keyword_stopwords(custom_stopwords)
+
+    nlp = _get_spacy_model("en_core_web_sm")
+    if nlp is None:
+        return [
+            _fallback_keywords(text, stop_words, custom, max_keywords, min_length)
+            if text
+            else []
+            for text in texts
         ]
 
-        return list(dict.fromkeys(keywords))[:max_keywords]
+    docs = nlp.pipe((text.lower() for text in texts if text), batch_size=batch_size)
+    return [
+        _keywords_from_doc(next(docs), stop_words, custom, max_keywords, min_length)
+        if text
+        else []
+        for text in texts
+    ]
 
 
 def validate_email(email: str) -> bool:
@@ -157,8 +327,7 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
 
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(email_pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def safe_filename(filename: str, max_length: int = 200) -> str:
@@ -176,13 +345,13 @@ def safe_filename(filename: str, max_length: int = 200) -> str:
         return "untitled"
 
     # Remove/replace invalid characters
-    safe_chars = re.sub(r'[<>:"/\\|?*]', "_", filename)
+    safe_chars = _INVALID_FNAME_RE.sub("_", filename)
 
     # Remove control characters
-    safe_chars = re.sub(r"[\x00-\x1f\x7f]", "", safe_chars)
+    safe_chars = _CONTROL_CHARS_RE.sub("", safe_chars)
 
     # Collapse multiple underscores
-    safe_chars = re.sub(r"_+", "_", safe_chars)
+    safe_chars = _MULTI_UNDERSCORE_RE.sub("_", safe_chars)
 
     # Strip leading/trailing spaces and dots
     safe_chars = safe_chars.strip(" .")
@@ -228,25 +397,28 @@ def chunk_text(
             chunks.append(text[start:])
             break
 
-        # Try to find a good break point
+        # Try to find a good break point. Searches are bounded to the window
+        # [start, end) with rfind's start/end arguments instead of slicing, so
+        # no substring is copied per probe; positions are absolute.
         chunk_end = end
+        min_break = start + chunk_size // 2  # Only break in the latter half
 
         # Look for separator within the last part of the chunk
-        sep_pos = text[start:end].rfind(separator)
-        if sep_pos > chunk_size // 2:  # Only use if separator is in the latter half
-            chunk_end = start + sep_pos + len(separator)
+        sep_pos = text.rfind(separator, start, end)
+        if sep_pos > min_break:
+            chunk_end = sep_pos + len(separator)
         else:
             # Look for sentence endings
-            for punct in [". ", "! ", "? "]:
-                punct_pos = text[start:end].rfind(punct)
-                if punct_pos > chunk_size // 2:
-                    chunk_end = start + punct_pos + len(punct)
+            for punct in (". ", "! ", "? "):
+                punct_pos = text.rfind(punct, start, end)
+                if punct_pos > min_break:
+                    chunk_end = punct_pos + len(punct)
                     break
             else:
                 # Look for word boundaries
-                space_pos = text[start:end].rfind(" ")
-                if space_pos > chunk_size // 2:
-                    chunk_end = start + space_pos + 1
+                space_pos = text.rfind(" ", start, end)
+                if space_pos > min_break:
+                    chunk_end = space_pos + 1
 
         chunks.append(text[start:chunk_end].strip())
 
@@ -256,16 +428,35 @@ def chunk_text(
     return [chunk for chunk in chunks if chunk.strip()]
 
 
+def _get_encoding():
+    """
+    Get the cached tiktoken ``cl100k_base`` encoding.
+
+    tiktoken is optional: returns None when it is not installed or its
+    encoding data cannot be loaded, and callers fall back to heuristics.
+    """
+    global _ENCODING
+    if _ENCODING is None:
+        try:
+            import tiktoken
+
+            _ENCODING = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _ENCODING = False
+    return _ENCODING or None
+
+
 def estimate_tokens(text: str, chars_per_token: float = 4.0) -> int:
     """
     Estimate the number of tokens in a text.
 
-    This is a simple estimation. For more accurate token counting,
-    use the actual tokenizer of the target LLM model.
+    Uses the tiktoken ``cl100k_base`` encoding when available, which gives
+    exact counts for OpenAI-style models. Otherwise falls back to a simple
+    character-based estimate.
 
     Args:
         text: Input text
-        chars_per_token: Average characters per token
+        chars_per_token: Average characters per token (fallback only)
 
     Returns:
         Estimated token count
@@ -273,23 +464,44 @@ def estimate_tokens(text: str, chars_per_token: float = 4.0) -> int:
     if not text:
         return 0
 
-    # Simple word-based estimation that's usually more accurate than pure character count
-    word_count = len(text.split())
-    char_estimate = int(len(text) / chars_per_token)
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return max(1, int(len(text) / chars_per_token))
+
+
+def _trim_to_boundary(truncated: str, max_chars: int) -> str:
+    """Cut truncated text back to a sentence or word boundary near its end."""
+    # Only boundaries in the last 20% count, so we don't lose too much text
+    start = int(max_chars * 0.8) + 1
+
+    # Find the last sentence ending in one pass over the tail
+    last_end = None
+    for last_end in _SENT_END_RE.finditer(truncated, start):
+        pass
+    if last_end is not None:
+        return truncated[: last_end.start() + 1].strip()
 
-    # Use the average of word count and character-based estimate
-    # This tends to be more accurate for most texts
-    return int((word_count + char_estimate) / 2)
+    # If no good sentence boundary, truncate at word boundary
+    last_space = truncated.rfind(" ", start)
+    if last_space != -1:
+        return truncated[:last_space].strip()
+
+    return truncated.strip()
 
 
 def truncate_text(text: str, max_tokens: int, chars_per_token: float = 4.0) -> str:
     """
     Truncate text to fit within token limit.
 
+    With tiktoken available the cut is made at exactly ``max_tokens`` tokens;
+    otherwise the limit is converted to characters.
+
     Args:
         text: Input text
         max_tokens: Maximum allowed tokens
-        chars_per_token: Average characters per token
+        chars_per_token: Average characters per token (fallback only)
 
     Returns:
         Truncated text
@@ -297,23 +509,18 @@ def truncate_text(text: str, max_tokens: int, chars_per_token: float = 4.0) -> s
     if not text:
         return ""
 
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        truncated = encoding.decode(tokens[:max_tokens])
+        return _trim_to_boundary(truncated, len(truncated))
+
     max_chars = int(max_tokens * chars_per_token)
 
     if len(text) <= max_chars:
         return text
 
     # Truncate and try to end at a sentence boundary
-    truncated = text[:max_chars]
-
-    # Find the last sentence ending
-    for punct in [". ", "! ", "? "]:
-        last_punct = truncated.rfind(punct)
-        if last_punct > max_chars * 0.8:  # Only if we don't lose too much text
-            return truncated[: last_punct + 1].strip()
-
-    # If no good sentence boundary, truncate at word boundary
-    last_space = truncated.rfind(" ")
-    if last_space > max_chars * 0.8:
-        return truncated[:last_space].strip()
-
-    return truncated.strip()
+    return _trim_to_boundary(text[:max_chars], max_chars)
@@ -1,11 +1,17 @@
 """Logging configuration and utilities for the literature review agent."""
 
+import os
 import sys
+import traceback
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
+import orjson
 from loguru import logger
 
+if TYPE_CHECKING:
+    from loguru import Logger
+
 # Import Rich handler if available
 try:
     from .display import get_rich_handler
@@ -14,6 +20,52 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+def _allows_debug(level: str) -> bool:
+    """Return True if a sink at ``level`` would accept DEBUG records."""
+    try:
+        return logger.level(level.upper()).no <= logger.level("DEBUG").no
+    except ValueError:
+        # Unknown level name: err on the side of emitting debug output
+        return True
+
+
+# Whether DEBUG records can reach a sink. Lets the debug-only helpers below
+# return before entering loguru's dispatch. Until setup_logger() runs, this
+# follows loguru's default stderr sink, whose level is LOGURU_LEVEL (DEBUG
+# unless overridden), so the helpers log as before in scripts and tests.
+_DEBUG_ENABLED = _allows_debug(os.getenv("LOGURU_LEVEL", "DEBUG"))
+
+
+def set_debug_enabled(enabled: bool) -> None:
+    """Toggle the debug-helper fast path at runtime."""
+    global _DEBUG_ENABLED
+    _DEBUG_ENABLED = enabled
+
+
+def _json_format(record: Dict[str, Any]) -> str:
+    """Serialize a record to one JSON line for the file sink.
+
+    orjson encodes the record in a single C call; loguru then only has to
+    substitute the pre-built line into the returned template.
+    """
+    payload = {
+        "t": record["time"].isoformat(),
+        "lvl": record["level"].name,
+        "name": record["name"],
+        "func": record["function"],
+        "line": record["line"],
+        "msg": record["message"],
+    }
+    if record["exception"] is not None:
+        # loguru doesn't append {exception} to callable formats, so the
+        # traceback has to travel inside the JSON line
+        exc_type, exc_value, exc_tb = record["exception"]
+        payload["exc"] = "".join(
+            traceback.format_exception(exc_type, exc_value, exc_tb)
+        )
+    record["extra"]["_json"] = orjson.dumps(payload, default=str).decode()
+    return "{extra[_json]}\n"
+
 
 def setup_logger(
     log_level: str = "INFO",
@@ -21,13 +73,14 @@ def setup_logger(
     rotation: str = "10 MB",
     retention: str = "1 week",
     use_rich: bool = True,
-) -> logger:
+) -> "Logger":
     """
     Setup and configure the logger for the application.
 
     Args:
         log_level: The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Path to the log file. If None, only console logging is used.
+        log_file: Path to the log file (one JSON record per line). If None,
+            only console logging is used.
         rotation: Log file rotation settings
         retention: Log file retention settings
         use_rich: Whether to use Rich formatting for console output
@@ -38,25 +91,17 @@ def setup_logger(
     # Remove default logger
     logger.remove()
 
+    set_debug_enabled(_allows_debug(log_level))
+
     # Configure console logging
     if use_rich and RICH_AVAILABLE:
-        # Use Rich handler for enhanced console output
-        import logging
-
-        # Create a standard logging logger to bridge with Rich
-        logging_logger = logging.getLogger("lit_review_agent")
-        logging_logger.setLevel(getattr(logging, log_level.upper()))
-
-        # Add Rich handler to standard logger
-        rich_handler = get_rich_handler()
-        rich_handler.setLevel(getattr(logging, log_level.upper()))
-        logging_logger.addHandler(rich_handler)
-
-        # Configure loguru to forward to standard logging
+        # Register RichHandler directly as a loguru sink. Rich renders the
+        # time and level columns itself, and the callable format keeps loguru
+        # from appending its own traceback next to Rich's.
         logger.add(
-            lambda message: logging_logger.info(message.rstrip("\n")),
+            get_rich_handler(show_locals=log_level.upper() == "DEBUG"),
             level=log_level,
-            format="{message}",
+            format=lambda _: "{message}",
             colorize=False,
         )
     else:
@@ -79,10 +124,7 @@ def setup_logger(
         logger.add(
             log_path,
             level=log_level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | "
-            "{level: <8} | "
-            "{name}:{function}:{line} - "
-            "{message}",
+            format=_json_format,
             rotation=rotation,
             retention=retention,
             compression="zip",
@@ -92,7 +134,7 @@ def setup_logger(
     return logger
 
 
-def get_logger(name: str) -> logger:
+def get_logger(name: str) -> "Logger":
     """
     Get a logger instance with the specified name.
 
@@ -108,31 +150,66 @@ def get_logger(name: str) -> logger:
 class LoggerMixin:
     """Mixin class to add logging capabilities to any class."""
 
+    # No per-instance state, so slotted subclasses stay free of __dict__
+    __slots__ = ()
+
+    @classmethod
+    def _cls_logger(cls) -> "Logger":
+        """Return the bound logger for this class, creating it on first use.
+
+        The cache is looked up in ``cls.__dict__`` so subclasses get their own
+        logger name instead of inheriting the parent's.
+        """
+        bound = cls.__dict__.get("_logger_cache")
+        if bound is None:
+            bound = get_logger(f"{cls.__module__}.{cls.__name__}")
+            cls._logger_cache = bound
+        return bound
+
     @property
-    def logger(self) -> logger:
+    def logger(self) -> "Logger":
         """Get a logger instance for this class."""
-        return get_logger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        return type(self)._cls_logger()
+
+
+# Utility functions for common logging patterns.
+# Messages use loguru's deferred "{}" formatting, and parameter strings are
+# built by lambdas under opt(lazy=True), so nothing is formatted when the level
+# is filtered out. Callers should still avoid computing expensive kwargs just
+# to pass them here.
+def _join_params(params: Dict[str, Any]) -> str:
+    return ", ".join(f"{k}={v}" for k, v in params.items())
 
 
-# Utility functions for common logging patterns
 def log_function_entry(func_name: str, **kwargs) -> None:
     """Log function entry with parameters."""
-    params = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-    logger.debug(f"Entering {func_name}({params})")
+    if not _DEBUG_ENABLED:
+        return
+    logger.opt(lazy=True).debug(
+        "Entering {func}({params})",
+        func=lambda: func_name,
+        params=lambda: _join_params(kwargs),
+    )
 
 
 def log_function_exit(func_name: str, result=None) -> None:
     """Log function exit with optional result."""
+    if not _DEBUG_ENABLED:
+        return
     if result is not None:
-        logger.debug(f"Exiting {func_name} with result: {result}")
+        logger.debug("Exiting {} with result: {}", func_name, result)
     else:
-        logger.debug(f"Exiting {func_name}")
+        logger.debug("Exiting {}", func_name)
 
 
 def log_api_call(api_name: str, endpoint: str, **kwargs) -> None:
     """Log API call details."""
-    params = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-    logger.info(f"API Call: {api_name} -> {endpoint} ({params})")
+    logger.opt(lazy=True).info(
+        "API Call: {api} -> {endpoint} ({params})",
+        api=lambda: api_name,
+        endpoint=lambda: endpoint,
+        params=lambda: _join_params(kwargs),
+    )
 
 
 def log_error_with_context(error: Exception, context: str = "") -> None:
@@ -142,10 +219,15 @@ def log_error_with_context(error: Exception, context: str = "") -> None:
         error_msg = f"{context}: {error_msg}"
 
     logger.error(error_msg)
-    logger.debug(f"Error details: {type(error).__name__}: {error}")
+    if _DEBUG_ENABLED:
+        logger.debug("Error details: {}: {}", type(error).__name__, error)
 
 
 def log_performance(operation: str, duration: float, **metrics) -> None:
     """Log performance metrics."""
-    metric_str = ", ".join(f"{k}={v}" for k, v in metrics.items())
-    logger.info(f"Performance: {operation} took {duration:.2f}s ({metric_str})")
+    logger.opt(lazy=True).info(
+        "Performance: {operation} took {duration:.2f}s ({metrics})",
+        operation=lambda: operation,
+        duration=lambda: duration,
+        metrics=lambda: _join_params(metrics),
+    )
@@ -1,125 +1,379 @@
 """Performance monitoring utilities for the literature review agent."""
 
+import asyncio
+import inspect
+import os
 import time
 import functools
+import itertools
+import numpy as np
+import orjson
 import psutil
+import sys
 import threading
-from typing import Dict, Any, Optional, Callable
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List, Optional, Callable, Tuple, Union
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timedelta, timezone
 
 from .logger import LoggerMixin
 
 
+class _AtomicCounter:
+    """Counter whose increment is one ``next()`` on an ``itertools.count``.
+
+    ``next()`` on a count object is a single C call, so concurrent increments
+    from tasks and threads cannot interleave the way ``dict[key] += 1`` can.
+    Reading also advances the count, so reads are tracked and subtracted.
+    """
+    
+    __slots__ = ("_count", "_reads", "_read_lock", "increment")
+    
+    def __init__(self):
+        self._count = itertools.count()
+        self._reads = 0
+        self._read_lock = threading.Lock()
+        # Bound once so the hot path is a single C-level call
+        self.increment = functools.partial(next, self._count)
+    
+    def value(self) -> int:
+        """Return the number of increments so far."""
+        with self._read_lock:
+            current = next(self._count) - self._reads
+            self._reads += 1
+        return current
+
+
+class _RingSamples:
+    """Fixed-size ring of int64 nanosecond samples backed by a NumPy array."""
+    
+    __slots__ = ("buf", "idx", "count")
+    
+    def __init__(self, size: int):
+        self.buf = np.empty(size, dtype=np.int64)
+        self.idx = 0  # Next write position
+        self.count = 0  # Samples written over the lifetime
+    
+    def __len__(self) -> int:
+        return min(self.count, len(self.buf))
+    
+    def extend(self, samples: List[int]):
+        """Write samples, overwriting the oldest once the ring is full."""
+        size = len(self.buf)
+        n = len(samples)
+        if n >= size:
+            self.buf[:] = samples[-size:]
+            self.idx = 0
+        else:
+            end = self.idx + n
+            if end <= size:
+                self.buf[self.idx:end] = samples
+            else:
+                split = size - self.idx
+                self.buf[self.idx:] = samples[:split]
+                self.buf[: n - split] = samples[split:]
+            self.idx = end % size
+        self.count += n
+    
+    def values(self) -> np.ndarray:
+        """The retained samples as a view (not in arrival order)."""
+        return self.buf[: len(self)]
+
+
 class PerformanceMetrics:
     """Container for performance metrics."""
     
+    # Samples a thread buffers per function before publishing them
+    FLUSH_THRESHOLD = 64
+    
+    __slots__ = (
+        "max_samples",
+        "execution_times",
+        "stats",
+        "api_calls",
+        "memory_usage",
+        "cpu_usage",
+        "error_counts",
+        "cache_hits",
+        "cache_misses",
+        "_local",
+        "_buffers",
+        "_flush_lock",
+        "dirty",
+    )
+    
     def __init__(self):
-        self.execution_times = defaultdict(deque)  # Function name -> execution times
-        self.api_calls = defaultdict(int)  # API endpoint -> call count
+        # Keep only last 1000 execution times per function
+        self.max_samples = 1000
+        
+        # Function name -> recent execution times (ns) in a fixed NumPy ring
+        self.execution_times = defaultdict(lambda: _RingSamples(self.max_samples))
+        # Function name -> running [count, total, min, max] over every call (ns)
+        self.stats = defaultdict(lambda: [0, 0, None, 0])
+        self.api_calls = Counter()  # API endpoint -> call count
         self.memory_usage = deque(maxlen=100)  # Recent memory usage samples
         self.cpu_usage = deque(maxlen=100)  # Recent CPU usage samples
-        self.error_counts = defaultdict(int)  # Error type -> count
-        self.cache_stats = {"hits": 0, "misses": 0}
+        self.error_counts = Counter()  # Error type -> count
+        self.cache_hits = _AtomicCounter()
+        self.cache_misses = _AtomicCounter()
         
-        # Keep only last 1000 execution times per function
-        self.max_samples = 1000
+        # Per-thread sample buffers (function name -> pending samples). Each
+        # thread appends to its own lists; they are published under the lock
+        # when one fills up or when stats are read.
+        self._local = threading.local()
+        self._buffers: List[Tuple[threading.Thread, Dict[str, List[int]]]] = []
+        self._flush_lock = threading.Lock()
+        
+        # Set by every add_* call and cleared when a summary is built, so an
+        # unchanged snapshot can be served from cache. A plain bool store is
+        # atomic under the GIL, so no lock is needed.
+        self.dirty = True
+    
+    def add_execution_time(self, function_name: str, execution_time: int):
+        """Add execution time for a function, in integer nanoseconds."""
+        self.dirty = True
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = {}
+            with self._flush_lock:
+                self._buffers.append((threading.current_thread(), buffer))
+        
+        pending = buffer.get(function_name)
+        if pending is None:
+            pending = buffer[function_name] = []
+        pending.append(execution_time)
+        if len(pending) >= self.FLUSH_THRESHOLD:
+            with self._flush_lock:
+                self._publish(function_name, pending)
+    
+    def _publish(self, function_name: str, pending: List[int]):
+        """Move buffered samples into the shared stats; caller holds the lock."""
+        # Snapshot, then delete only what was taken: the owning thread may
+        # append concurrently, and its new samples land after the snapshot
+        samples = pending[:]
+        del pending[: len(samples)]
+        if not samples:
+            return
+        
+        agg = self.stats[function_name]
+        
+        # Once a function has filled its sample window, keep only every
+        # rate-th call (rate = calls so far // window) so the ring work stops
+        # growing with call volume; the aggregates below still see every call
+        seen = agg[0]
+        rate = seen // self.max_samples
+        if rate > 1:
+            self.execution_times[function_name].extend(samples[-seen % rate :: rate])
+        else:
+            self.execution_times[function_name].extend(samples)
+        
+        agg[0] += len(samples)
+        agg[1] += sum(samples)
+        low = min(samples)
+        if agg[2] is None or low < agg[2]:
+            agg[2] = low
+        high = max(samples)
+        if high > agg[3]:
+            agg[3] = high
+    
+    def flush(self):
+        """Publish every thread's buffered samples."""
+        with self._flush_lock:
+            live = []
+            for thread, buffer in self._buffers:
+                for function_name, pending in list(buffer.items()):
+                    self._publish(function_name, pending)
+                # Buffers of finished threads are drained now and can go
+                if thread.is_alive():
+                    live.append((thread, buffer))
+            self._buffers = live
     
-    def add_execution_time(self, function_name: str, execution_time: float):
-        """Add execution time for a function."""
-        times = self.execution_times[function_name]
-        times.append(execution_time)
-        if len(times) > self.max_samples:
-            times.popleft()
+    def snapshot(self) -> Tuple[
+        List[Tuple[str, int, int]], Dict[str, int], Dict[str, int], List[float], List[float]
+    ]:
+        """Publish buffered samples and copy the raw metrics under the lock.
+        
+        Returns ``(stats, api_calls, error_counts, memory_usage, cpu_usage)``
+        where ``stats`` holds ``(function name, count, total ns)`` triples.
+        The copies are safe to read while other threads keep recording.
+        """
+        self.flush()
+        with self._flush_lock:
+            stats = [(name, agg[0], agg[1]) for name, agg in list(self.stats.items())]
+            return (
+                stats,
+                dict(self.api_calls),
+                dict(self.error_counts),
+                list(self.memory_usage),
+                list(self.cpu_usage),
+            )
     
     def add_api_call(self, endpoint: str):
         """Record an API call."""
+        self.dirty = True
         self.api_calls[endpoint] += 1
     
     def add_error(self, error_type: str):
         """Record an error."""
+        self.dirty = True
         self.error_counts[error_type] += 1
     
-    def add_system_metrics(self):
-        """Add current system metrics."""
+    def add_system_metrics(self, proc: psutil.Process):
+        """Add current resource usage of the monitored process."""
+        self.dirty = True
         try:
-            # Memory usage in MB
-            memory_mb = psutil.virtual_memory().used / (1024 * 1024)
+            # Resident memory in MB (one read of /proc/<pid>/statm)
+            memory_mb = proc.memory_info().rss / (1024 * 1024)
             self.memory_usage.append(memory_mb)
             
-            # CPU usage percentage
-            cpu_percent = psutil.cpu_percent()
+            # CPU usage percentage since the previous sample
+            cpu_percent = proc.cpu_percent(None)
             self.cpu_usage.append(cpu_percent)
         except Exception:
             # Ignore errors in system monitoring
             pass
     
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Snapshot of cache hit/miss counts."""
+        return {"hits": self.cache_hits.value(), "misses": self.cache_misses.value()}
+    
     def get_function_stats(self, function_name: str) -> Dict[str, Any]:
         """Get statistics for a specific function."""
-        times = list(self.execution_times[function_name])
-        if not times:
+        self.flush()
+        return self._function_stats(function_name)
+    
+    def _function_stats(self, function_name: str) -> Dict[str, Any]:
+        agg = self.stats.get(function_name)
+        if not agg:
             return {"count": 0}
         
-        return {
-            "count": len(times),
-            "avg_time": sum(times) / len(times),
-            "min_time": min(times),
-            "max_time": max(times),
-            "total_time": sum(times)
+        # Aggregates are kept in integer nanoseconds; report seconds
+        count, total, min_time, max_time = agg
+        stats = {
+            "count": count,
+            "avg_time": total / count / 1e9,
+            "min_time": min_time / 1e9,
+            "max_time": max_time / 1e9,
+            "total_time": total / 1e9
         }
+        
+        # Percentiles over the retained samples, computed in one vectorized call
+        samples = self.execution_times[function_name].values()
+        if len(samples):
+            p50, p95 = np.percentile(samples, (50, 95))
+            stats["p50_time"] = float(p50) / 1e9
+            stats["p95_time"] = float(p95) / 1e9
+        return stats
     
-    def get_summary(self) -> Dict[str, Any]:
-        """Get a summary of all performance metrics."""
-        summary = {
-            "timestamp": datetime.now().isoformat(),
-            "functions": {},
-            "api_calls": dict(self.api_calls),
-            "errors": dict(self.error_counts),
-            "cache_stats": self.cache_stats.copy(),
-            "system": {}
+    def iter_summary(self) -> Iterator[Tuple[str, Any]]:
+        """Yield the summary one ``(section, value)`` pair at a time."""
+        self.flush()
+        # Left as a datetime; to_json() lets orjson format it in C. UTC so the
+        # exported value carries an explicit offset
+        yield "timestamp", datetime.now(timezone.utc)
+        yield "functions", {
+            func_name: self._function_stats(func_name) for func_name in self.stats
         }
-        
-        # Function performance
-        for func_name in self.execution_times:
-            summary["functions"][func_name] = self.get_function_stats(func_name)
+        yield "api_calls", dict(self.api_calls)
+        yield "errors", dict(self.error_counts)
+        yield "cache_stats", self.cache_stats
         
         # System metrics
+        system = {}
         if self.memory_usage:
-            summary["system"]["memory_mb"] = {
+            system["memory_mb"] = {
                 "current": self.memory_usage[-1],
                 "avg": sum(self.memory_usage) / len(self.memory_usage),
                 "max": max(self.memory_usage)
             }
         
         if self.cpu_usage:
-            summary["system"]["cpu_percent"] = {
+            system["cpu_percent"] = {
                 "current": self.cpu_usage[-1],
                 "avg": sum(self.cpu_usage) / len(self.cpu_usage),
                 "max": max(self.cpu_usage)
             }
-        
-        return summary
+        yield "system", system
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """Get a summary of all performance metrics."""
+        return dict(self.iter_summary())
 
 
 class PerformanceMonitor(LoggerMixin):
     """Performance monitoring system."""
     
+    # Seconds between system metric samples
+    SAMPLE_INTERVAL = 10
+    # Seconds a computed summary is reused by get_metrics()
+    SUMMARY_TTL = 1.0
+    
+    __slots__ = (
+        "metrics",
+        "enable_system_monitoring",
+        "_monitoring_thread",
+        "_stop_monitoring",
+        "_loop",
+        "_monitor_handle",
+        "_summary_cache",
+        "_proc",
+    )
+    
     def __init__(self, enable_system_monitoring: bool = True):
         super().__init__()
         self.metrics = PerformanceMetrics()
         self.enable_system_monitoring = enable_system_monitoring
         self._monitoring_thread = None
         self._stop_monitoring = threading.Event()
+        # Set when sampling runs on an asyncio loop instead of a thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._monitor_handle: Optional[asyncio.TimerHandle] = None
+        # (monotonic time computed, summary) for get_metrics()
+        self._summary_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        
+        # Handle on this process; the first cpu_percent() call only primes it
+        self._proc = psutil.Process()
+        self._proc.cpu_percent(None)
         
         if enable_system_monitoring:
             self.start_system_monitoring()
     
+    def _loop_monitoring_active(self) -> bool:
+        return (
+            self._monitor_handle is not None
+            and not self._monitor_handle.cancelled()
+            and self._loop is not None
+            and not self._loop.is_closed()
+        )
+    
     def start_system_monitoring(self):
-        """Start background system monitoring."""
+        """Start background system monitoring.
+        
+        Inside a running event loop (e.g. the API server) samples are
+        scheduled with ``loop.call_later``; otherwise a daemon thread is used.
+        """
+        if self._loop_monitoring_active():
+            return
         if self._monitoring_thread and self._monitoring_thread.is_alive():
             return
         
         self._stop_monitoring.clear()
+        # Drop any handle left over from a loop that has since closed
+        self._monitor_handle = None
+        self._loop = None
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop is not None:
+            self._loop = loop
+            self._monitor_handle = loop.call_later(self.SAMPLE_INTERVAL, self._tick)
+            self.logger.info("Started system performance monitoring on event loop")
+            return
+        
         self._monitoring_thread = threading.Thread(
             target=self._system_monitoring_loop,
             daemon=True
@@ -129,19 +383,33 @@ class PerformanceMonitor(LoggerMixin):
     
     def stop_system_monitoring(self):
         """Stop background system monitoring."""
+        if self._monitor_handle is not None:
+            self._stop_monitoring.set()
+            self._monitor_handle.cancel()
+            self._monitor_handle = None
+            self._loop = None
+            self.logger.info("Stopped system performance monitoring")
+        
         if self._monitoring_thread and self._monitoring_thread.is_alive():
             self._stop_monitoring.set()
             self._monitoring_thread.join(timeout=5)
             self.logger.info("Stopped system performance monitoring")
     
+    def _tick(self):
+        """Take one sample and reschedule on the event loop."""
+        if self._stop_monitoring.is_set() or self._loop is None:
+            return
+        self.metrics.add_system_metrics(self._proc)
+        self._monitor_handle = self._loop.call_later(self.SAMPLE_INTERVAL, self._tick)
+    
     def _system_monitoring_loop(self):
         """Background loop for system monitoring."""
-        while not self._stop_monitoring.wait(10):  # Sample every 10 seconds
-            self.metrics.add_system_metrics()
+        while not self._stop_monitoring.wait(self.SAMPLE_INTERVAL):
+            self.metrics.add_system_metrics(self._proc)
     
     def record_execution_time(self, function_name: str, execution_time: float):
-        """Record execution time for a function."""
-        self.metrics.add_execution_time(function_name, execution_time)
+        """Record execution time for a function, given in seconds."""
+        self.metrics.add_execution_time(function_name, int(execution_time * 1e9))
     
     def record_api_call(self, endpoint: str):
         """Record an API call."""
@@ -153,75 +421,204 @@ class PerformanceMonitor(LoggerMixin):
     
     def record_cache_hit(self):
         """Record a cache hit."""
-        self.metrics.cache_stats["hits"] += 1
+        self.metrics.dirty = True
+        self.metrics.cache_hits.increment()
     
     def record_cache_miss(self):
         """Record a cache miss."""
-        self.metrics.cache_stats["misses"] += 1
+        self.metrics.dirty = True
+        self.metrics.cache_misses.increment()
+    
+    def reset(self):
+        """Discard all collected metrics, keeping this monitor instance."""
+        self.metrics = PerformanceMetrics()
+        self._summary_cache = (0.0, None)
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Get current performance metrics."""
-        return self.metrics.get_summary()
+        """Get current performance metrics.
+        
+        The summary is rebuilt only when something was recorded since the last
+        one, and then at most once per ``SUMMARY_TTL`` seconds, so frequent
+        polling (e.g. a metrics endpoint) reuses the same dict.
+        """
+        metrics = self.metrics
+        computed_at, summary = self._summary_cache
+        if summary is not None and not metrics.dirty:
+            return summary
+        now = time.monotonic()
+        if summary is None or now - computed_at >= self.SUMMARY_TTL:
+            # Cleared before building so records made meanwhile re-mark it
+            metrics.dirty = False
+            summary = metrics.get_summary()
+            self._summary_cache = (now, summary)
+        return summary
     
-    def log_performance_summary(self):
-        """Log a performance summary."""
-        summary = self.get_metrics()
+    def to_json(self) -> bytes:
+        """Serialize the current metrics with orjson."""
+        # Second precision is plenty for a metrics timestamp
+        return orjson.dumps(self.get_metrics(), option=orjson.OPT_OMIT_MICROSECONDS)
+    
+    def iter_log_lines(self) -> Iterator[str]:
+        """Yield the performance summary as formatted log lines.
         
-        self.logger.info("=== Performance Summary ===")
+        Works from a raw snapshot of the metrics instead of building the
+        summary dict, which is only needed for JSON export.
+        """
+        metrics = self.metrics
+        # Lines are yielded lazily, so format from copies: the live dicts can
+        # change while the consumer is suspended between lines
+        stats, api_calls, error_counts, memory, cpu = metrics.snapshot()
+        
+        yield "=== Performance Summary ==="
         
         # Function performance
-        if summary["functions"]:
-            self.logger.info("Function Performance:")
-            for func_name, stats in summary["functions"].items():
-                if stats["count"] > 0:
-                    self.logger.info(
-                        f"  {func_name}: {stats['count']} calls, "
-                        f"avg: {stats['avg_time']:.3f}s, "
-                        f"total: {stats['total_time']:.3f}s"
+        if stats:
+            yield "Function Performance:"
+            for func_name, count, total in stats:
+                if count > 0:
+                    yield (
+                        f"  {func_name}: {count} calls, "
+                        f"avg: {total / count / 1e9:.3f}s, "
+                        f"total: {total / 1e9:.3f}s"
                     )
         
         # API calls
-        if summary["api_calls"]:
-            self.logger.info("API Calls:")
-            for endpoint, count in summary["api_calls"].items():
-                self.logger.info(f"  {endpoint}: {count} calls")
+        if api_calls:
+            yield "API Calls:"
+            for endpoint, count in api_calls.items():
+                yield f"  {endpoint}: {count} calls"
         
         # Cache performance
-        cache_stats = summary["cache_stats"]
-        total_cache_requests = cache_stats["hits"] + cache_stats["misses"]
+        hits = metrics.cache_hits.value()
+        total_cache_requests = hits + metrics.cache_misses.value()
         if total_cache_requests > 0:
-            hit_rate = cache_stats["hits"] / total_cache_requests * 100
-            self.logger.info(f"Cache Hit Rate: {hit_rate:.1f}% ({cache_stats['hits']}/{total_cache_requests})")
+            hit_rate = hits / total_cache_requests * 100
+            yield f"Cache Hit Rate: {hit_rate:.1f}% ({hits}/{total_cache_requests})"
         
         # System metrics
-        if summary["system"]:
-            system = summary["system"]
-            if "memory_mb" in system:
-                mem = system["memory_mb"]
-                self.logger.info(f"Memory Usage: {mem['current']:.1f}MB (avg: {mem['avg']:.1f}MB)")
-            if "cpu_percent" in system:
-                cpu = system["cpu_percent"]
-                self.logger.info(f"CPU Usage: {cpu['current']:.1f}% (avg: {cpu['avg']:.1f}%)")
+        if memory:
+            yield f"Memory Usage: {memory[-1]:.1f}MB (avg: {sum(memory) / len(memory):.1f}MB)"
+        if cpu:
+            yield f"CPU Usage: {cpu[-1]:.1f}% (avg: {sum(cpu) / len(cpu):.1f}%)"
         
         # Errors
-        if summary["errors"]:
-            self.logger.info("Errors:")
-            for error_type, count in summary["errors"].items():
-                self.logger.info(f"  {error_type}: {count}")
+        if error_counts:
+            yield "Errors:"
+            for error_type, count in error_counts.items():
+                yield f"  {error_type}: {count}"
+    
+    def log_performance_summary(self):
+        """Log a performance summary."""
+        for line in self.iter_log_lines():
+            self.logger.info(line)
+
+
+class NullPerformanceMonitor:
+    """Monitor that records nothing, used when monitoring is switched off."""
+    
+    __slots__ = ()
+    
+    enable_system_monitoring = False
+    
+    def start_system_monitoring(self):
+        pass
+    
+    def stop_system_monitoring(self):
+        pass
+    
+    def record_execution_time(self, function_name: str, execution_time: float):
+        pass
+    
+    def record_api_call(self, endpoint: str):
+        pass
+    
+    def record_error(self, error_type: str):
+        pass
+    
+    def record_cache_hit(self):
+        pass
+    
+    def record_cache_miss(self):
+        pass
+    
+    def reset(self):
+        pass
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return an empty summary with the usual sections."""
+        return PerformanceMetrics().get_summary()
+    
+    def to_json(self) -> bytes:
+        return orjson.dumps(self.get_metrics(), option=orjson.OPT_OMIT_MICROSECONDS)
+    
+    def log_performance_summary(self):
+        pass
+
 
+# LIT_REVIEW_MONITOR=0 turns monitoring off: the decorators return the
+# function unchanged and get_performance_monitor() hands out a null monitor
+_MONITORING_ENABLED = os.getenv("LIT_REVIEW_MONITOR", "1") != "0"
 
 # Global performance monitor instance
 _performance_monitor = None
 
 
-def get_performance_monitor() -> PerformanceMonitor:
+def get_performance_monitor() -> Union[PerformanceMonitor, NullPerformanceMonitor]:
     """Get the global performance monitor instance."""
     global _performance_monitor
     if _performance_monitor is None:
-        _performance_monitor = PerformanceMonitor()
+        if _MONITORING_ENABLED:
+            _performance_monitor = PerformanceMonitor()
+        else:
+            _performance_monitor = NullPerformanceMonitor()
     return _performance_monitor
 
 
+def reset_performance_monitor() -> None:
+    """
+    Clear the global monitor's metrics (e.g. between tests).
+    
+    Decorated functions cache the monitor after their first call, so the
+    global instance is reset in place rather than replaced.
+    """
+    if _performance_monitor is not None:
+        _performance_monitor.reset()
+
+
+# Set LIT_REVIEW_FAST_DECORATORS=1 to copy only the naming attributes onto
+# wrappers instead of the full functools.update_wrapper treatment
+_FAST_DECORATORS = os.getenv("LIT_REVIEW_FAST_DECORATORS") == "1"
+
+
+def _copy_wrapper_attrs(wrapper: Callable, wrapped: Callable) -> Callable:
+    """Make ``wrapper`` look like ``wrapped`` (see ``_FAST_DECORATORS``)."""
+    if not _FAST_DECORATORS:
+        return functools.update_wrapper(wrapper, wrapped)
+    
+    # Names and docs only; skips the __dict__ copy and __wrapped__
+    for attr in ("__module__", "__name__", "__qualname__", "__doc__"):
+        try:
+            setattr(wrapper, attr, getattr(wrapped, attr))
+        except AttributeError:
+            pass
+    return wrapper
+
+
+def _is_async_callable(f: Callable) -> bool:
+    """Whether calling ``f`` returns an awaitable that should be awaited.
+    
+    Sees through ``functools.partial`` layers and objects with an
+    ``async def __call__``. Async generator functions are not included:
+    their wrapper has to hand back the generator without awaiting it.
+    """
+    while isinstance(f, functools.partial):
+        f = f.func
+    if asyncio.iscoroutinefunction(f):
+        return True
+    call = getattr(type(f), "__call__", None)
+    return not inspect.isfunction(f) and asyncio.iscoroutinefunction(call)
+
+
 def monitor_performance(func: Optional[Callable] = None, *, name: Optional[str] = None):
     """
     Decorator to monitor function performance.
@@ -240,43 +637,54 @@ def monitor_performance(func: Optional[Callable] = None, *, name: Optional[str]
             pass
     """
     def decorator(f):
-        function_name = name or f.__name__
+        if not _MONITORING_ENABLED:
+            return f
         
-        @functools.wraps(f)
-        def wrapper(*args, **kwargs):
-            monitor = get_performance_monitor()
-            start_time = time.time()
+        # Partials and callable instances have no __name__ of their own. The
+        # name is interned once so per-call dict lookups compare by identity
+        function_name = sys.intern(name or getattr(f, "__name__", type(f).__name__))
+        # Monotonic integer clock, bound locally to skip the attribute lookup
+        _perf = time.perf_counter_ns
+        # Resolved on first call, then reused (see reset_performance_monitor)
+        monitor = None
+        
+        # Build only the wrapper that matches the function type
+        if _is_async_callable(f):
+            async def async_wrapper(*args, **kwargs):
+                nonlocal monitor
+                if monitor is None:
+                    monitor = get_performance_monitor()
+                metrics = monitor.metrics
+                start = _perf()
+                
+                try:
+                    result = await f(*args, **kwargs)
+                    return result
+                except Exception as e:
+                    metrics.add_error(type(e).__name__)
+                    raise
+                finally:
+                    metrics.add_execution_time(function_name, _perf() - start)
             
-            try:
-                result = f(*args, **kwargs)
-                return result
-            except Exception as e:
-                monitor.record_error(type(e).__name__)
-                raise
-            finally:
-                execution_time = time.time() - start_time
-                monitor.record_execution_time(function_name, execution_time)
+            return _copy_wrapper_attrs(async_wrapper, f)
         
-        @functools.wraps(f)
-        async def async_wrapper(*args, **kwargs):
-            monitor = get_performance_monitor()
-            start_time = time.time()
+        def wrapper(*args, **kwargs):
+            nonlocal monitor
+            if monitor is None:
+                monitor = get_performance_monitor()
+            metrics = monitor.metrics
+            start = _perf()
             
             try:
-                result = await f(*args, **kwargs)
+                result = f(*args, **kwargs)
                 return result
             except Exception as e:
-                monitor.record_error(type(e).__name__)
+                metrics.add_error(type(e).__name__)
                 raise
             finally:
-                execution_time = time.time() - start_time
-                monitor.record_execution_time(function_name, execution_time)
+                metrics.add_execution_time(function_name, _perf() - start)
         
-        # Return appropriate wrapper based on function type
-        if hasattr(f, '__code__') and f.__code__.co_flags & 0x80:  # CO_COROUTINE
-            return async_wrapper
-        else:
-            return wrapper
+        return _copy_wrapper_attrs(wrapper, f)
     
     if func is None:
         # Called with arguments: @monitor_performance(name="custom")
@@ -295,23 +703,34 @@ def monitor_api_call(endpoint: str):
         async def search_arxiv():
             pass
     """
+    # Interned once so the per-call Counter lookup compares by identity
+    endpoint = sys.intern(endpoint)
+    
     def decorator(func):
-        @functools.wraps(func)
+        if not _MONITORING_ENABLED:
+            return func
+        
+        # Resolved on first call, then reused (see reset_performance_monitor)
+        monitor = None
+        
+        # Build only the wrapper that matches the function type
+        if _is_async_callable(func):
+            async def async_wrapper(*args, **kwargs):
+                nonlocal monitor
+                if monitor is None:
+                    monitor = get_performance_monitor()
+                monitor.metrics.add_api_call(endpoint)
+                return await func(*args, **kwargs)
+            
+            return _copy_wrapper_attrs(async_wrapper, func)
+        
         def wrapper(*args, **kwargs):
-            monitor = get_performance_monitor()
-            monitor.record_api_call(endpoint)
+            nonlocal monitor
+            if monitor is None:
+                monitor = get_performance_monitor()
+            monitor.metrics.add_api_call(endpoint)
             return func(*args, **kwargs)
         
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            monitor = get_performance_monitor()
-            monitor.record_api_call(endpoint)
-            return await func(*args, **kwargs)
-        
-        # Return appropriate wrapper based on function type
-        if hasattr(func, '__code__') and func.__code__.co_flags & 0x80:  # CO_COROUTINE
-            return async_wrapper
-        else:
-            return wrapper
+        return _copy_wrapper_attrs(wrapper, func)
     
     return decorator
@@ -2,6 +2,7 @@
 """启动 API 服务器"""
 
 import asyncio
+import os
 import sys
 import uvicorn
 from pathlib import Path
@@ -19,6 +20,11 @@ def main():
     print("❤️  健康检查: http://localhost:8000/health")
     print()
     
+    # uvloop 不支持 Windows，回退到默认 asyncio 事件循环
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    # worker 数量与 Dockerfile 一致，通过 UVICORN_WORKERS 环境变量配置
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
+
     try:
         # 启动 FastAPI 服务器
         uvicorn.run(
@@ -27,7 +33,12 @@ def main():
             port=8000,
             reload=False,  # 生产环境关闭热重载
             log_level="info",
-            access_log=True
+            access_log=True,
+            loop=loop,
+            http="httptools",  # C 实现的 HTTP 解析器，比默认的 h11 更快
+            workers=workers,
+            backlog=2048,
+            timeout_keep_alive=30,
         )
     except KeyboardInterrupt:
         print("\n👋 服务器已停止")
@@ -0,0 +1,116 @@
+"""Tests for the ArXiv client's batched ID lookup and request coalescing."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+from lit_review_agent.retrieval.arxiv_client import ArxivClient
+
+
+class FakeResult:
+    """Minimal stand-in for ``arxiv.Result`` with the fields the client reads."""
+
+    def __init__(self, short_id: str):
+        self.entry_id = f"http://arxiv.org/abs/{short_id}"
+        self.title = f"Paper {short_id}"
+        self.authors = ["Doe, J."]
+        self.summary = "An abstract."
+        self.published = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self.updated = None
+        self.journal_ref = None
+        self.doi = None
+        self.pdf_url = f"http://arxiv.org/pdf/{short_id}"
+        self.categories = ["cs.LG"]
+        self.primary_category = "cs.LG"
+        self.comment = None
+        self.links = []
+
+    def get_short_id(self) -> str:
+        # Same as arxiv.Result.get_short_id()
+        return self.entry_id.split("arxiv.org/abs/")[-1]
+
+
+class FakeArxivAPI:
+    """Returns the latest version of every requested ID, like the real API."""
+
+    def __init__(self, known_ids):
+        self.known_ids = known_ids
+        self.delay_seconds = 0.0
+
+    def results(self, search):
+        for short_id in self.known_ids:
+            if any(short_id.startswith(requested) for requested in search.id_list):
+                yield FakeResult(short_id)
+
+
+def make_client(known_ids) -> ArxivClient:
+    client = ArxivClient()
+    client.client = FakeArxivAPI(known_ids)
+    return client
+
+
+def test_get_by_ids_matches_old_style_versioned_and_unversioned_ids():
+    client = make_client(["hep-th/9901001v1", "2301.12345v2", "2302.00001v1"])
+    requested = ["hep-th/9901001", "2301.12345v2", "2302.00001"]
+
+    found = asyncio.run(client.get_by_ids(requested))
+
+    assert set(found) == set(requested)
+    assert found["hep-th/9901001"].url == "http://arxiv.org/abs/hep-th/9901001v1"
+    assert found["2301.12345v2"].url == "http://arxiv.org/abs/2301.12345v2"
+    assert found["2302.00001"].url == "http://arxiv.org/abs/2302.00001v1"
+
+
+def test_get_by_id_finds_old_style_id():
+    client = make_client(["hep-th/9901001v1"])
+
+    item = asyncio.run(client.get_by_id("hep-th/9901001"))
+
+    assert item is not None
+    assert item.url == "http://arxiv.org/abs/hep-th/9901001v1"
+
+
+class SlowFailingArxivAPI:
+    """Fails every search after a delay, recording how many overlap."""
+
+    def __init__(self, duration: float):
+        self.duration = duration
+        self.delay_seconds = 0.0
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def results(self, search):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.duration)
+            raise RuntimeError("upstream error")
+        finally:
+            with self._lock:
+                self.running -= 1
+        yield  # pragma: no cover - makes this a generator
+
+
+def test_identical_searches_never_run_upstream_in_parallel():
+    client = ArxivClient()
+    api = client.client = SlowFailingArxivAPI(duration=0.2)
+
+    async def late_search():
+        # Arrives while the second caller is running after the lock handoff
+        await asyncio.sleep(0.3)
+        return await client.search("q")
+
+    async def run():
+        return await asyncio.gather(
+            client.search("q"), client.search("q"), late_search())
+
+    results = asyncio.run(run())
+
+    # Failed searches are not cached, so each caller went upstream in turn
+    assert results == [[], [], []]
+    assert api.max_running == 1
+    assert not client._inflight_locks
+    assert not client._inflight_users